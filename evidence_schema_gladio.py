@@ -6,8 +6,9 @@ Comprehensive fact library structure for intelligence analysis
 
 import json
 import sqlite3
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Set, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
 
@@ -266,16 +267,68 @@ class Relationship:
     implications: List[str] = None
 
 
+def _enum_value(obj):
+    """json.dumps default: store Enums by value"""
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+
+
+# Name -> ID: lowercase, spaces to underscores, dots dropped
+_ENTITY_ID_TABLE = str.maketrans({' ': '_', '.': None})
+
+
+def entity_id(name: str) -> str:
+    """Person/organization ID for a name ("Licio Gelli" -> "licio_gelli"), shared by every writer"""
+    return name.lower().translate(_ENTITY_ID_TABLE)
+
+
 class GladioEvidenceDatabase:
     """Database for managing Operation Gladio evidence"""
 
     def __init__(self, db_path: str = "gladio_evidence.db"):
         self.db_path = db_path
+        self._conn = None  # Shared connection while inside transaction()
         self.init_database()
 
+    @contextmanager
+    def transaction(self):
+        """Run many add_* calls on one connection with a single commit
+
+        sqlite3 caches prepared statements per connection, so repeated
+        INSERTs inside the block are compiled once.
+        """
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn = conn
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._conn = None
+            conn.close()
+
+    def _execute_write(self, sql: str, params: tuple):
+        """Execute a write, committing immediately unless inside transaction()"""
+        if self._conn is not None:
+            self._conn.execute(sql, params)
+            return
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute(sql, params)
+            conn.commit()
+        finally:
+            conn.close()
+
     def init_database(self):
         """Initialize database tables"""
         conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA journal_mode=WAL")  # Persistent: writers no longer block readers
         cursor = conn.cursor()
 
         # People table
@@ -283,6 +336,7 @@ class GladioEvidenceDatabase:
             CREATE TABLE IF NOT EXISTS people (
                 person_id TEXT PRIMARY KEY,
                 dossier_json TEXT,
+                content_hash TEXT,
                 created TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
@@ -293,6 +347,7 @@ class GladioEvidenceDatabase:
             CREATE TABLE IF NOT EXISTS organizations (
                 organization_id TEXT PRIMARY KEY,
                 organization_json TEXT,
+                content_hash TEXT,
                 created TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
@@ -345,24 +400,14 @@ class GladioEvidenceDatabase:
     def add_person(self, person: PersonDossier) -> bool:
         """Add person to database"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
             person.dossier_created = datetime.now().isoformat()
             person.last_updated = datetime.now().isoformat()
 
-            def json_serializer(obj):
-                if isinstance(obj, Enum):
-                    return obj.value
-                raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
-
-            cursor.execute('''
+            self._execute_write('''
                 INSERT OR REPLACE INTO people (person_id, dossier_json, last_updated)
                 VALUES (?, ?, CURRENT_TIMESTAMP)
-            ''', (person.person_id, json.dumps(asdict(person), indent=2, default=json_serializer)))
+            ''', (person.person_id, json.dumps(asdict(person), indent=2, default=_enum_value)))
 
-            conn.commit()
-            conn.close()
             return True
         except Exception as e:
             print(f"Error adding person {person.person_id}: {e}")
@@ -371,52 +416,108 @@ class GladioEvidenceDatabase:
     def add_organization(self, org: Organization) -> bool:
         """Add organization to database"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
             org.created = datetime.now().isoformat()
             org.last_updated = datetime.now().isoformat()
 
-            def json_serializer(obj):
-                if isinstance(obj, Enum):
-                    return obj.value
-                raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
-
-            cursor.execute('''
+            self._execute_write('''
                 INSERT OR REPLACE INTO organizations (organization_id, organization_json, last_updated)
                 VALUES (?, ?, CURRENT_TIMESTAMP)
-            ''', (org.organization_id, json.dumps(asdict(org), indent=2, default=json_serializer)))
+            ''', (org.organization_id, json.dumps(asdict(org), indent=2, default=_enum_value)))
 
-            conn.commit()
-            conn.close()
             return True
         except Exception as e:
             print(f"Error adding organization {org.organization_id}: {e}")
             return False
 
-    def add_relationship(self, rel: Relationship) -> bool:
-        """Add relationship to database"""
+    def add_people_bulk(self, people: List[PersonDossier]) -> int:
+        """Add many people with one executemany in a single transaction"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            now = datetime.now().isoformat()
+            rows = []
+            for person in people:
+                person.dossier_created = now
+                person.last_updated = now
+                rows.append((person.person_id, json.dumps(asdict(person), indent=2, default=_enum_value)))
+
+            if rows:
+                with self.transaction() as conn:
+                    conn.executemany('''
+                        INSERT OR REPLACE INTO people (person_id, dossier_json, last_updated)
+                        VALUES (?, ?, CURRENT_TIMESTAMP)
+                    ''', rows)
+
+            return len(rows)
+        except Exception as e:
+            print(f"Error adding {len(people)} people: {e}")
+            return 0
 
-            def json_serializer(obj):
-                if isinstance(obj, Enum):
-                    return obj.value
-                raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+    def add_organizations_bulk(self, orgs: List[Organization]) -> int:
+        """Add many organizations with one executemany in a single transaction"""
+        try:
+            now = datetime.now().isoformat()
+            rows = []
+            for org in orgs:
+                org.created = now
+                org.last_updated = now
+                rows.append((org.organization_id, json.dumps(asdict(org), indent=2, default=_enum_value)))
+
+            if rows:
+                with self.transaction() as conn:
+                    conn.executemany('''
+                        INSERT OR REPLACE INTO organizations (organization_id, organization_json, last_updated)
+                        VALUES (?, ?, CURRENT_TIMESTAMP)
+                    ''', rows)
+
+            return len(rows)
+        except Exception as e:
+            print(f"Error adding {len(orgs)} organizations: {e}")
+            return 0
 
-            cursor.execute('''
+    def add_relationship(self, rel: Relationship) -> bool:
+        """Add relationship to database"""
+        try:
+            self._execute_write('''
                 INSERT OR REPLACE INTO relationships (relationship_id, relationship_json)
                 VALUES (?, ?)
-            ''', (rel.relationship_id, json.dumps(asdict(rel), indent=2, default=json_serializer)))
+            ''', (rel.relationship_id, json.dumps(asdict(rel), indent=2, default=_enum_value)))
 
-            conn.commit()
-            conn.close()
             return True
         except Exception as e:
             print(f"Error adding relationship {rel.relationship_id}: {e}")
             return False
 
+    def count_people(self) -> int:
+        """Number of people stored"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute("SELECT COUNT(*) FROM people").fetchone()[0]
+        finally:
+            conn.close()
+
+    def count_organizations(self) -> int:
+        """Number of organizations stored"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute("SELECT COUNT(*) FROM organizations").fetchone()[0]
+        finally:
+            conn.close()
+
+    def person_ids(self) -> Set[str]:
+        """IDs of every person already stored (primary key scan, no JSON decoding)"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return {row[0] for row in conn.execute("SELECT person_id FROM people")}
+        finally:
+            conn.close()
+
+    def organization_ids(self) -> Set[str]:
+        """IDs of every organization already stored (primary key scan, no JSON decoding)"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return {row[0] for row in conn.execute("SELECT organization_id FROM organizations")}
+        finally:
+            conn.close()
+
     def search_people(self, query: str) -> List[PersonDossier]:
         """Search people by name or alias"""
         conn = sqlite3.connect(self.db_path)
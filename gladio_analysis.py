@@ -17,6 +17,16 @@ from evidence_schema_gladio import (
 )
 
 
+# Relationship confidence weights used for weighted degree centrality
+CONFIDENCE_WEIGHTS = {
+    'confirmed': 1.0,
+    'probable': 0.8,
+    'possible': 0.6,
+    'disputed': 0.4,
+    'unverified': 0.2
+}
+
+
 class GladioAnalyzer:
     """Advanced analysis tools for Operation Gladio evidence"""
 
@@ -41,6 +51,7 @@ class GladioAnalyzer:
 
         # Build network graph
         network = defaultdict(list)
+        edges = set()
         entity_types = {}
         relationship_types = Counter()
 
@@ -48,19 +59,27 @@ class GladioAnalyzer:
             entity1 = rel['entity_1']
             entity2 = rel['entity_2']
             rel_type = rel['relationship_type']
+            # Stored JSON may carry explicit nulls
+            confidence = rel.get('confidence') or 'possible'
 
             network[entity1].append({
                 'target': entity2,
                 'type': rel_type,
-                'confidence': rel.get('confidence', 'possible')
+                'confidence': confidence
             })
 
             network[entity2].append({
                 'target': entity1,
                 'type': rel_type,
-                'confidence': rel.get('confidence', 'possible')
+                'confidence': confidence
             })
 
+            # One row per undirected edge for the exported graph (sortable: no None)
+            edges.add((
+                min(entity1, entity2), max(entity1, entity2),
+                rel_type or '', confidence
+            ))
+
             entity_types[entity1] = rel['entity_1_type']
             entity_types[entity2] = rel['entity_2_type']
             relationship_types[rel_type] += 1
@@ -91,7 +110,7 @@ class GladioAnalyzer:
             },
             'clusters': clusters,
             'hidden_patterns': hidden_patterns,
-            'network_graph': dict(network)
+            'edges': [list(edge) for edge in sorted(edges)]
         }
 
         return analysis
@@ -100,23 +119,12 @@ class GladioAnalyzer:
         """Calculate centrality scores for network entities"""
         centrality = {}
 
-        for entity in network:
-            # Simple degree centrality (number of connections)
-            degree = len(network[entity])
-
-            # Weighted by relationship confidence
-            weighted_degree = 0
-            for connection in network[entity]:
-                confidence_weight = {
-                    'confirmed': 1.0,
-                    'probable': 0.8,
-                    'possible': 0.6,
-                    'disputed': 0.4,
-                    'unverified': 0.2
-                }.get(connection['confidence'], 0.6)
-                weighted_degree += confidence_weight
-
-            centrality[entity] = weighted_degree
+        for entity, connections in network.items():
+            # Degree weighted by relationship confidence
+            centrality[entity] = sum(
+                CONFIDENCE_WEIGHTS.get(connection['confidence'], 0.6)
+                for connection in connections
+            )
 
         return centrality
 
@@ -8,23 +8,169 @@ Memory: <200MB per batch
 Pattern: Incremental Save Pattern (prevents data loss from crashes)
 """
 
-import json
+import mmap
+from array import array
+import os
 import re
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Set, Optional, Iterator, Sequence
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
+import orjson
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Patterns of the form \b(Name One|Name Two)\b: plain literals, no regex syntax
+LITERAL_ALTERNATION = re.compile(r"\\b\(([\w '-]+(?:\|[\w '-]+)*)\)\\b")
+
+def compile_pattern(pattern: str):
+    """Compile with RE2 when available, falling back to re for unsupported syntax"""
+    if RE2_AVAILABLE:
+        options = re2.Options()
+        options.log_errors = False
+        try:
+            return re2.compile(pattern, options)
+        except re2.error:
+            # RE2 has no lookaround; such patterns stay on the backtracking engine
+            pass
+    return re.compile(pattern)
+
+
+def is_word_char(char: str) -> bool:
+    """Whether re's Unicode \\b counts char as part of a word"""
+    return char.isalnum() or char == '_'
+
+
+def regex_scanner(pattern: str):
+    """Scanner yielding (start, end, name_start, name_end) for each match of pattern in a line
+
+    A (?P<name>...) group narrows the reported name to part of the match.
+    """
+    regex = re.compile(pattern)
+    # RE2's \b and \w are ASCII-only, so it only scans pure-ASCII lines
+    ascii_regex = compile_pattern(pattern)
+    name_group = regex.groupindex.get('name')
+
+    def scan(line: str):
+        scanner = ascii_regex if line.isascii() else regex
+        for match in scanner.finditer(line):
+            start, end = match.span()
+            name_start, name_end = match.span(name_group) if name_group else (-1, -1)
+            if name_start < 0:
+                name_start, name_end = start, end
+            yield start, end, name_start, name_end
+
+    return scan
+
+
+def literal_scanner(patterns: List[str]):
+    """Aho-Corasick scanner for LITERAL_ALTERNATION patterns, same hits as their union"""
+    automaton = ahocorasick.Automaton()
+    order = 0
+    for pattern in patterns:
+        for word in LITERAL_ALTERNATION.fullmatch(pattern).group(1).split('|'):
+            # A name listed twice keeps its first (highest-priority) position
+            if word not in automaton:
+                automaton.add_word(word, (order, len(word)))
+            order += 1
+    automaton.make_automaton()
+
+    def scan(line: str):
+        # Every occurrence, including ones nested in a longer name that may
+        # fail its boundary check ("Vatican" in "the Vatican Banker")
+        hits = []
+        for last, (order, length) in automaton.iter(line):
+            start, end = last - length + 1, last + 1
+            if start > 0 and is_word_char(line[start - 1]):
+                continue
+            if end < len(line) and is_word_char(line[end]):
+                continue
+            hits.append((start, order, end))
 
-@dataclass
+        # Resolve overlaps like the regex alternation: leftmost start, then first listed name
+        hits.sort()
+        last_end = 0
+        for start, _, end in hits:
+            if start >= last_end:
+                yield start, end, start, end
+                last_end = end
+
+    return scan
+
+
+def checkpoint_files(checkpoint_dir: Path) -> List[Path]:
+    """Entity batch checkpoint files (plain or zstd-compressed) in batch order
+
+    A batch with both forms (a crash between writing the .zst and removing
+    the plain file) is listed once, as its .zst.
+    """
+    checkpoint_dir = Path(checkpoint_dir)
+    files = {path.name[:-len('.json')]: path for path in checkpoint_dir.glob("batch_*.json")}
+    files.update(
+        (path.name[:-len('.json.zst')], path) for path in checkpoint_dir.glob("batch_*.json.zst")
+    )
+    return [files[stem] for stem in sorted(files)]
+
+
+def atomic_write(path: Path, data: bytes):
+    """Write via a temp file and os.replace so a crash never leaves a torn file"""
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def read_checkpoint(path: Path) -> Dict:
+    """Load one batch checkpoint, decompressing .zst files"""
+    data = Path(path).read_bytes()
+    if str(path).endswith('.zst'):
+        if not ZSTD_AVAILABLE:
+            raise ImportError(f"zstandard is required to read {path}")
+        data = zstandard.ZstdDecompressor().decompress(data)
+    return orjson.loads(data)
+
+
+@dataclass(slots=True)
 class EntityMention:
-    """Single mention of an entity in transcript"""
+    """Single mention of an entity in transcript (slotted: no per-instance __dict__)"""
     name: str
     entity_type: str  # "person" or "organization"
     context: str  # Surrounding text
     line_number: int
     confidence: float = 0.8
 
+    def to_dict(self) -> Dict:
+        """Flat dict for checkpoints (avoids asdict's recursive deep copy)"""
+        return {
+            'name': self.name,
+            'entity_type': self.entity_type,
+            'context': self.context,
+            'line_number': self.line_number,
+            'confidence': self.confidence
+        }
+
 
 @dataclass
 class CheckpointManifest:
@@ -42,28 +188,35 @@ class BatchEntityExtractor:
         self,
         transcript_path: Path,
         checkpoint_dir: Path,
-        batch_size: int = 50
+        batch_size: int = 50,
+        workers: Optional[int] = None
     ):
         self.transcript_path = Path(transcript_path)
         self.checkpoint_dir = Path(checkpoint_dir)
         self.batch_size = batch_size
+        self.workers = workers or os.cpu_count() or 1
 
         # Create checkpoint directory
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
 
-        # Manifest tracking
+        # Compress batch checkpoints (repeated names/contexts shrink 3-5x)
+        self.compress_checkpoints = ZSTD_AVAILABLE
+
+        # Manifest tracking (flushed every N batches rather than per batch)
         self.manifest_path = self.checkpoint_dir / "manifest.json"
+        self.manifest_flush_every = 16
 
         # Known entities patterns (expanded from transcript reading)
         self.person_patterns = [
             r'\b(Alan Dulles|William Donovan|Heinrich Himmler|Walter Schellenberg)\b',
-            r'\b(Michele Sindona|Roberto Calvi|Archbishop Paul Marcinkus)\b',
+            r'\b(Michele Sindona|Roberto Calvi|Paul Marcinkus)\b',  # "Archbishop ..." hits the titled pattern
             r'\b(Licio Gelli|Pope John Paul II|Pope Paul VI)\b',
             r'\b(Osama bin Laden|Abdullah Azam|Timothy Drew|Malcolm X)\b',
             r'\b(George H\.? ?W\.? Bush|William Casey|Vernon Walters)\b',
             r'\b(Giulio Andreotti|Aldo Moro|Tansu Ciller)\b',
             r'\b(Felice Casson|Arthur Rouse|Malcolm Byrne)\b',
-            r'\b(Dr\.|General|Admiral|Archbishop|Cardinal|Sheikh|Prince)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b',
+            # Title is matched but not captured: the name group is the cleaned-up name
+            r'\b(?:Dr\.|General|Admiral|Archbishop|Cardinal|Sheikh|Prince)\s+(?P<name>[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b',
             r'\b([A-Z][a-z]+\s+(?:de\s+)?[A-Z][a-z]+)\b(?=\s+(?:said|worked|founded|paid|served|testified))',
         ]
 
@@ -74,19 +227,94 @@ class BatchEntityExtractor:
             r'\b(Opus Dei|Mafia|Sicilian Mafia|Gambino crime family)\b',
             r'\b(Mujahideen|Al-Qaeda|PKK|Kurdistan Workers)\b',
             r'\b(Senate|Parliament|Supreme Court|National Security Council)\b',
-            r'\b(the\s+)?(CIA|Vatican|Mafia|Church|Agency)\b',
+            r'\b(CIA|Vatican|Mafia|Church|Agency)\b',
         ]
 
+        # Scanners run people first, then organizations. The plain literal name
+        # lists of one type share a scanner (an Aho-Corasick automaton when
+        # available); every other pattern gets its own, so a greedy pattern such
+        # as the titled name cannot swallow names another pattern would find.
+        self._scanners = []
+        for entity_type, patterns in (('person', self.person_patterns), ('organization', self.org_patterns)):
+            literal_patterns = [p for p in patterns if LITERAL_ALTERNATION.fullmatch(p)]
+            if literal_patterns:
+                if AHOCORASICK_AVAILABLE:
+                    scan = literal_scanner(literal_patterns)
+                else:
+                    scan = regex_scanner("|".join(f"(?:{p})" for p in literal_patterns))
+                self._scanners.append((entity_type, scan))
+            for pattern in patterns:
+                if not LITERAL_ALTERNATION.fullmatch(pattern):
+                    self._scanners.append((entity_type, regex_scanner(pattern)))
+
+        # Byte offsets of transcript line starts, built on first use and kept
+        # next to the checkpoints so resumed runs skip the newline scan
+        self._line_offsets = None
+        self.line_offsets_path = self.checkpoint_dir / "line_offsets.bin"
+
+    def line_offsets(self) -> Sequence[int]:
+        """Byte offset of every line start in the transcript, plus end of file"""
+        if self._line_offsets is None:
+            self._line_offsets = self.load_line_offsets()
+
+        if self._line_offsets is None:
+            with self.open_transcript() as mm:
+                offsets = array('q', [0])
+                pos = mm.find(b'\n')
+                while pos != -1:
+                    offsets.append(pos + 1)
+                    pos = mm.find(b'\n', pos + 1)
+                if offsets[-1] != len(mm):
+                    offsets.append(len(mm))
+            self._line_offsets = offsets
+            self.save_line_offsets(offsets)
+
+        return self._line_offsets
+
+    def load_line_offsets(self) -> Optional[array]:
+        """Load the saved line offset index, or None if missing or stale"""
+        if not self.line_offsets_path.exists():
+            return None
+
+        transcript_stat = self.transcript_path.stat()
+        if self.line_offsets_path.stat().st_mtime < transcript_stat.st_mtime:
+            return None
+
+        offsets = array('q')
+        with open(self.line_offsets_path, 'rb') as f:
+            offsets.frombytes(f.read())
+
+        # Must end at the current end of file
+        if not offsets or offsets[-1] != transcript_stat.st_size:
+            return None
+
+        return offsets
+
+    def save_line_offsets(self, offsets: array):
+        """Save the line offset index (raw int64 array)"""
+        atomic_write(self.line_offsets_path, offsets.tobytes())
+
+    @contextmanager
+    def open_transcript(self):
+        """Memory-map the transcript read-only; the OS pages it in on demand"""
+        with open(self.transcript_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # mmap cannot map an empty file
+                yield b''
+                return
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield mm
+
     def load_manifest(self) -> CheckpointManifest:
         """Load checkpoint manifest or create new one"""
         if self.manifest_path.exists():
-            with open(self.manifest_path) as f:
-                data = json.load(f)
+            with open(self.manifest_path, 'rb') as f:
+                data = orjson.loads(f.read())
                 return CheckpointManifest(**data)
 
         # Count total batches
-        with open(self.transcript_path) as f:
-            total_lines = sum(1 for _ in f)
+        total_lines = len(self.line_offsets()) - 1
         total_batches = (total_lines + self.batch_size - 1) // self.batch_size
 
         return CheckpointManifest(
@@ -99,58 +327,62 @@ class BatchEntityExtractor:
     def save_manifest(self, manifest: CheckpointManifest):
         """Save checkpoint manifest"""
         manifest.last_updated = datetime.now().isoformat()
-        with open(self.manifest_path, 'w') as f:
-            json.dump(asdict(manifest), f, indent=2)
+        atomic_write(self.manifest_path, orjson.dumps(asdict(manifest)))
+
+    def find_entities(self, line: str):
+        """Yield (entity_type, start, end, name_start, name_end) hits in one line
+
+        start/end span the whole match; name_start/name_end span just the name.
+        Hits from one scanner never overlap; hits from different scanners may.
+        """
+        for entity_type, scan in self._scanners:
+            for start, end, name_start, name_end in scan(line):
+                yield entity_type, start, end, name_start, name_end
 
     def extract_entities_from_batch(
         self,
-        lines: List[str],
+        buffer,
+        line_offsets: Sequence[int],
         start_line: int
     ) -> List[EntityMention]:
-        """Extract entities from a batch of lines"""
+        """Extract entities from consecutive lines of the raw transcript buffer
+
+        line_offsets holds the byte offset of each line start plus the end of
+        the last line. Each line is decoded before scanning so word boundaries
+        see accented letters as letters.
+        """
         entities = []
 
-        for i, line in enumerate(lines):
-            line_num = start_line + i
-
-            # Extract people
-            for pattern in self.person_patterns:
-                for match in re.finditer(pattern, line):
-                    name = match.group(0)
-                    # Clean up titles
-                    name = re.sub(r'^(Dr\.|General|Admiral|Archbishop|Cardinal|Sheikh|Prince)\s+', '', name)
-
-                    # Get context (50 chars before/after)
-                    start = max(0, match.start() - 50)
-                    end = min(len(line), match.end() + 50)
-                    context = line[start:end].strip()
-
-                    entities.append(EntityMention(
-                        name=name,
-                        entity_type="person",
-                        context=context,
-                        line_number=line_num,
-                        confidence=0.8
-                    ))
-
-            # Extract organizations
-            for pattern in self.org_patterns:
-                for match in re.finditer(pattern, line):
-                    name = match.group(0)
-                    # Clean up
-                    name = re.sub(r'^the\s+', '', name, flags=re.IGNORECASE)
-
-                    start = max(0, match.start() - 50)
-                    end = min(len(line), match.end() + 50)
-                    context = line[start:end].strip()
-
-                    entities.append(EntityMention(
-                        name=name,
-                        entity_type="organization",
-                        context=context,
-                        line_number=line_num,
-                        confidence=0.8
-                    ))
+        # Hot loop: bind attribute lookups to locals once per batch
+        append = entities.append
+        find_entities = self.find_entities
+        mention = EntityMention
+
+        for line_num, (line_start, line_end) in enumerate(
+            zip(line_offsets, line_offsets[1:]), start_line
+        ):
+            line = buffer[line_start:line_end].decode('utf-8', 'replace')
+            line_len = len(line)
+
+            # Name spans already reported on this line
+            seen = set()
+
+            for entity_type, match_start, match_end, name_start, name_end in find_entities(line):
+                # Two scanners hitting the same name at the same place ("Roberto
+                # Calvi said" matches the name list and the "X said" pattern)
+                key = (entity_type, name_start, name_end)
+                if key in seen:
+                    continue
+                seen.add(key)
+                name = line[name_start:name_end]
+
+                # Get context (50 chars before/after)
+                start = match_start - 50 if match_start > 50 else 0
+                end = match_end + 50 if match_end + 50 < line_len else line_len
+                context = line[start:end].strip()
+
+                # Positional construction skips keyword-argument matching per mention
+                append(mention(name, entity_type, context, line_num, 0.8))
 
         return entities
 
@@ -158,15 +390,60 @@ class BatchEntityExtractor:
         """Save entities from a batch to checkpoint file"""
         checkpoint_file = self.checkpoint_dir / f"batch_{batch_id:03d}.json"
 
-        entities_data = [asdict(e) for e in entities]
+        entities_data = [e.to_dict() for e in entities]
+
+        payload = orjson.dumps({
+            'batch_id': batch_id,
+            'entity_count': len(entities),
+            'entities': entities_data,
+            'timestamp': time.time()  # epoch seconds; cheaper than formatting per batch
+        })
+
+        if self.compress_checkpoints:
+            compressed = zstandard.ZstdCompressor(level=3).compress(payload)
+            atomic_write(checkpoint_file.with_suffix('.json.zst'), compressed)
+            # Drop a plain copy left by an earlier uncompressed run
+            checkpoint_file.unlink(missing_ok=True)
+        else:
+            atomic_write(checkpoint_file, payload)
+
+    def iter_pending_batches(self, manifest: CheckpointManifest):
+        """Yield (batch_id, start_line, line_offsets) for batches not yet completed"""
+        completed = set(manifest.completed_batches)
+        offsets = self.line_offsets()
+        total_lines = len(offsets) - 1
+
+        for batch_id, start_idx in enumerate(range(0, total_lines, self.batch_size)):
+            if batch_id in completed:
+                print(f"  Batch {batch_id:3d}: SKIPPED (already completed)")
+                continue
 
-        with open(checkpoint_file, 'w') as f:
-            json.dump({
-                'batch_id': batch_id,
-                'entity_count': len(entities),
-                'entities': entities_data,
-                'timestamp': datetime.now().isoformat()
-            }, f, indent=2)
+            # Tasks carry offsets only; completed batches' pages are never read
+            end_idx = min(start_idx + self.batch_size, total_lines)
+            yield batch_id, start_idx, offsets[start_idx:end_idx + 1]
+
+    def extract_batches(self, tasks):
+        """Extract entities for each task, in order, across worker processes"""
+        if self.workers <= 1:
+            with self.open_transcript() as mm:
+                for batch_id, start_idx, line_offsets in tasks:
+                    yield batch_id, self.extract_entities_from_batch(mm, line_offsets, start_idx)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.transcript_path, self.checkpoint_dir, self.batch_size)
+        ) as executor:
+            # Bound in-flight batches so results are written as they arrive
+            pending = deque()
+            for task in tasks:
+                pending.append(executor.submit(_extract_batch_worker, task))
+                if len(pending) >= self.workers * 2:
+                    yield pending.popleft().result()
+
+            while pending:
+                yield pending.popleft().result()
 
     def process_transcript(self) -> Dict[str, int]:
         """Process entire transcript in batches with checkpoints"""
@@ -177,39 +454,30 @@ class BatchEntityExtractor:
         print(f"Total batches: {manifest.total_batches}")
         print(f"Completed batches: {len(manifest.completed_batches)}")
         print(f"Checkpoint dir: {self.checkpoint_dir}")
+        print(f"Workers: {self.workers}")
 
-        with open(self.transcript_path) as f:
-            lines = f.readlines()
-
-        batch_id = 0
         total_entities = 0
-
-        for start_idx in range(0, len(lines), self.batch_size):
-            # Skip if already completed
-            if batch_id in manifest.completed_batches:
-                print(f"  Batch {batch_id:3d}: SKIPPED (already completed)")
-                batch_id += 1
-                continue
-
-            # Get batch
-            end_idx = min(start_idx + self.batch_size, len(lines))
-            batch_lines = lines[start_idx:end_idx]
-
-            # Extract entities
-            entities = self.extract_entities_from_batch(batch_lines, start_idx)
-
-            # Save checkpoint
-            self.save_batch_checkpoint(batch_id, entities)
-
-            # Update manifest
-            manifest.completed_batches.append(batch_id)
-            manifest.entities_extracted += len(entities)
-            self.save_manifest(manifest)
-
-            total_entities += len(entities)
-            print(f"  Batch {batch_id:3d}: {len(entities)} entities extracted")
-
-            batch_id += 1
+        unflushed = 0
+
+        tasks = self.iter_pending_batches(manifest)
+        try:
+            for batch_id, entities in self.extract_batches(tasks):
+                # Save checkpoint
+                self.save_batch_checkpoint(batch_id, entities)
+
+                # Update manifest; a crash before the next flush only re-runs those batches
+                manifest.completed_batches.append(batch_id)
+                manifest.entities_extracted += len(entities)
+                unflushed += 1
+                if unflushed >= self.manifest_flush_every:
+                    self.save_manifest(manifest)
+                    unflushed = 0
+
+                total_entities += len(entities)
+                print(f"  Batch {batch_id:3d}: {len(entities)} entities extracted")
+        finally:
+            if unflushed:
+                self.save_manifest(manifest)
 
         print(f"\nExtraction complete!")
         print(f"  Total entities: {total_entities}")
@@ -221,17 +489,49 @@ class BatchEntityExtractor:
             'completed_batches': len(manifest.completed_batches)
         }
 
+    def iter_entities(self, read_threads: int = 8) -> Iterator[EntityMention]:
+        """Stream entities from checkpoints in batch order, decoding files in parallel"""
+        files = iter(checkpoint_files(self.checkpoint_dir))
+
+        # Keep a bounded window of reads in flight so memory stays flat
+        with ThreadPoolExecutor(max_workers=read_threads) as pool:
+            pending = deque(pool.submit(read_checkpoint, f) for _, f in zip(range(read_threads * 2), files))
+
+            while pending:
+                data = pending.popleft().result()
+                next_file = next(files, None)
+                if next_file is not None:
+                    pending.append(pool.submit(read_checkpoint, next_file))
+
+                for entity_data in data['entities']:
+                    yield EntityMention(**entity_data)
+
     def load_all_entities(self) -> List[EntityMention]:
         """Load all entities from checkpoints"""
-        all_entities = []
+        return list(self.iter_entities())
+
+
+# Per-process extractor and transcript map used by ProcessPoolExecutor workers
+_worker_extractor = None
+_worker_buffer = None
+_worker_resources = ExitStack()
 
-        for checkpoint_file in sorted(self.checkpoint_dir.glob("batch_*.json")):
-            with open(checkpoint_file) as f:
-                data = json.load(f)
-                for entity_data in data['entities']:
-                    all_entities.append(EntityMention(**entity_data))
 
-        return all_entities
+def _init_worker(transcript_path: Path, checkpoint_dir: Path, batch_size: int):
+    """Build the worker's extractor and map the transcript once per process"""
+    global _worker_extractor, _worker_buffer
+    _worker_extractor = BatchEntityExtractor(
+        transcript_path, checkpoint_dir, batch_size, workers=1
+    )
+    _worker_buffer = _worker_resources.enter_context(_worker_extractor.open_transcript())
+
+
+def _extract_batch_worker(task):
+    """Extract one (batch_id, start_line, line_offsets) task in a worker process"""
+    batch_id, start_idx, line_offsets = task
+    return batch_id, _worker_extractor.extract_entities_from_batch(
+        _worker_buffer, line_offsets, start_idx
+    )
 
 
 def main():
@@ -255,17 +555,20 @@ def main():
 
     # Show sample entities
     print("\nSample entities:")
-    entities = extractor.load_all_entities()
-
-    people = [e for e in entities if e.entity_type == "person"][:10]
-    orgs = [e for e in entities if e.entity_type == "organization"][:10]
-
-    print(f"\nPeople ({len([e for e in entities if e.entity_type == 'person'])} total):")
-    for p in people:
+    # Single pass over the stream: count both types, keep the first 10 of each
+    counts = {"person": 0, "organization": 0}
+    samples = {"person": [], "organization": []}
+    for e in extractor.iter_entities():
+        counts[e.entity_type] += 1
+        if len(samples[e.entity_type]) < 10:
+            samples[e.entity_type].append(e)
+
+    print(f"\nPeople ({counts['person']} total):")
+    for p in samples["person"]:
         print(f"  - {p.name} (line {p.line_number})")
 
-    print(f"\nOrganizations ({len([e for e in entities if e.entity_type == 'organization'])} total):")
-    for o in orgs:
+    print(f"\nOrganizations ({counts['organization']} total):")
+    for o in samples["organization"]:
         print(f"  - {o.name} (line {o.line_number})")
 
 
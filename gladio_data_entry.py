@@ -4,9 +4,11 @@ Operation Gladio Data Entry System
 Interactive tools for building fact libraries from source material
 """
 
+import csv
 import json
 import sys
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
 from evidence_schema_gladio import (
     GladioEvidenceDatabase, PersonDossier, Organization, ResourceFlow,
     Relationship, Evidence, Claim, TimeReference, LocationReference,
@@ -36,6 +38,7 @@ class GladioDataEntry:
             print("7. Analyze Networks")
             print("8. Export Evidence")
             print("9. Quick Entry Mode")
+            print("10. Bulk Import (CSV/JSONL)")
             print("0. Exit")
             print("-"*60)
 
@@ -59,6 +62,8 @@ class GladioDataEntry:
                 self.export_evidence()
             elif choice == "9":
                 self.quick_entry_mode()
+            elif choice == "10":
+                self.bulk_import_interactive()
             elif choice == "0":
                 print("📊 Evidence database session ended.")
                 break
@@ -73,9 +78,9 @@ class GladioDataEntry:
 
         # Basic identification
         first_name = input("First name: ").strip()
-        middle_names = input("Middle names (comma-separated): ").strip().split(",") if input("Middle names (comma-separated): ").strip() else []
+        middle_names = self.input_list("Middle names (comma-separated): ")
         last_name = input("Last name: ").strip()
-        aliases = input("Aliases (comma-separated): ").strip().split(",") if input("Aliases (comma-separated): ").strip() else []
+        aliases = self.input_list("Aliases (comma-separated): ")
 
         person_id = f"PERS_{last_name.upper()}_{first_name.upper()}"
 
@@ -123,7 +128,7 @@ class GladioDataEntry:
         print("-"*50)
 
         name = input("Organization name: ").strip()
-        aliases = input("Aliases (comma-separated): ").strip().split(",") if input("Aliases (comma-separated): ").strip() else []
+        aliases = self.input_list("Aliases (comma-separated): ")
 
         org_id = f"ORG_{name.upper().replace(' ', '_')}"
 
@@ -285,6 +290,11 @@ class GladioDataEntry:
         except ValueError:
             return None
 
+    def input_list(self, prompt: str) -> List[str]:
+        """Input comma-separated list (prompted once)"""
+        value = input(prompt).strip()
+        return [item.strip() for item in value.split(",")] if value else []
+
     def confirm(self, prompt: str) -> bool:
         """Confirmation prompt"""
         response = input(prompt).strip().lower()
@@ -323,8 +333,8 @@ class GladioDataEntry:
             except Exception as e:
                 print(f"❌ Error processing entry: {e}")
 
-    def quick_add_person(self, name: str, details: str, page: str = None):
-        """Quick add person from condensed information"""
+    def build_quick_person(self, name: str, details: str, page: str = None) -> PersonDossier:
+        """Build a person dossier from condensed information"""
         name_parts = name.strip().split()
         first_name = name_parts[0] if name_parts else "Unknown"
         last_name = name_parts[-1] if len(name_parts) > 1 else "Unknown"
@@ -350,18 +360,127 @@ class GladioDataEntry:
             overall_confidence=ConfidenceLevel.POSSIBLE
         )
 
-        person = PersonDossier(
+        return PersonDossier(
             person_id=person_id,
             first_name=first_name,
             last_name=last_name,
             significant_activities=[claim]
         )
 
+    def build_quick_organization(self, name: str, details: str, page: str = None) -> Organization:
+        """Build an organization from condensed information"""
+        name = name.strip()
+        org_id = f"ORG_{name.upper().replace(' ', '_')}"
+
+        evidence = Evidence(
+            evidence_id=f"EV_QUICK_{org_id}",
+            evidence_type=EvidenceType.BOOK,
+            description=details,
+            source=self.current_source,
+            page_reference=page,
+            confidence=ConfidenceLevel.POSSIBLE
+        )
+
+        claim = Claim(
+            claim_id=f"CL_QUICK_{org_id}",
+            statement=details,
+            category="organizational",
+            supporting_evidence=[evidence],
+            overall_confidence=ConfidenceLevel.POSSIBLE
+        )
+
+        return Organization(
+            organization_id=org_id,
+            name=name,
+            actual_activities=[claim]
+        )
+
+    def quick_add_person(self, name: str, details: str, page: str = None):
+        """Quick add person from condensed information"""
+        person = self.build_quick_person(name, details, page)
+
         if self.db.add_person(person):
             print(f"✅ Quick added: {name}")
         else:
             print(f"❌ Failed to add: {name}")
 
+    def quick_add_organization(self, name: str, details: str, page: str = None):
+        """Quick add organization from condensed information"""
+        org = self.build_quick_organization(name, details, page)
+
+        if self.db.add_organization(org):
+            print(f"✅ Quick added: {name}")
+        else:
+            print(f"❌ Failed to add: {name}")
+
+    def import_records(self, records: Iterable[Dict]) -> Dict[str, int]:
+        """Bulk import quick-entry style records without prompting
+
+        Each record has type (PERSON/ORG), name, details and optional page,
+        mirroring the TYPE|NAME|DETAILS|PAGE quick entry format. Entity
+        mentions from BatchEntityExtractor checkpoints are accepted as-is
+        (entity_type/context/line_number).
+        """
+        stats = {'people': 0, 'organizations': 0, 'skipped': 0, 'failed': 0}
+
+        # One connection and one commit for the whole import
+        with self.db.transaction():
+            for record in records:
+                entry_type = (record.get('type') or record.get('entity_type') or '').upper()
+                name = (record.get('name') or '').strip()
+                details = record.get('details') or record.get('context') or ''
+                page = record.get('page') or None
+                if not page and record.get('line_number') is not None:
+                    page = f"transcript line {record['line_number']}"
+
+                if not name:
+                    stats['skipped'] += 1
+                    continue
+
+                if entry_type == 'PERSON':
+                    if self.db.add_person(self.build_quick_person(name, details, page)):
+                        stats['people'] += 1
+                    else:
+                        stats['failed'] += 1
+                elif entry_type in ('ORG', 'ORGANIZATION'):
+                    if self.db.add_organization(self.build_quick_organization(name, details, page)):
+                        stats['organizations'] += 1
+                    else:
+                        stats['failed'] += 1
+                else:
+                    stats['skipped'] += 1
+
+        return stats
+
+    def import_csv(self, path: Path) -> Dict[str, int]:
+        """Bulk import from a CSV file with type,name,details,page columns"""
+        with open(path, newline='') as f:
+            return self.import_records(csv.DictReader(f))
+
+    def import_jsonl(self, path: Path) -> Dict[str, int]:
+        """Bulk import from a JSON Lines file (one record object per line)"""
+        with open(path) as f:
+            return self.import_records(json.loads(line) for line in f if line.strip())
+
+    def bulk_import_interactive(self):
+        """Import a CSV or JSONL file in one step"""
+        print("\n" + "-"*50)
+        print("📥 BULK IMPORT")
+        print("-"*50)
+
+        path = Path(input("File path (.csv or .jsonl): ").strip())
+        if not path.exists():
+            print(f"❌ File not found: {path}")
+            return
+
+        if path.suffix.lower() == '.csv':
+            stats = self.import_csv(path)
+        else:
+            stats = self.import_jsonl(path)
+
+        print(f"✅ Imported {stats['people']} people, {stats['organizations']} organizations "
+              f"({stats['skipped']} skipped, {stats['failed']} failed)")
+
     def search_menu(self):
         """Search and browse database"""
         print("\n" + "-"*50)
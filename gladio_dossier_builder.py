@@ -8,15 +8,26 @@ Memory: <200MB
 Pattern: Deduplication and aggregation
 """
 
-import json
+import heapq
+import sys
+from collections import Counter
 from pathlib import Path
-from typing import List, Dict, Set
-from dataclasses import dataclass, asdict, field
-from collections import defaultdict
+from typing import List, Dict, Set, Tuple, Iterable, Iterator
+from dataclasses import dataclass, field
 from datetime import datetime
 
+import orjson
 
-@dataclass
+from gladio_batch_entity_extractor import checkpoint_files, read_checkpoint
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+@dataclass(slots=True)
 class EntityDossier:
     """Consolidated dossier for a person or organization"""
     name: str
@@ -29,6 +40,30 @@ class EntityDossier:
     contexts: List[str] = field(default_factory=list)
     confidence: float = 0.0
 
+    def to_dict(self) -> Dict:
+        """Shallow dict for JSON output (lists shared, not deep-copied like asdict)"""
+        return {
+            'name': self.name,
+            'entity_type': self.entity_type,
+            'aliases': self.aliases,
+            'mention_count': self.mention_count,
+            'first_appearance_line': self.first_appearance_line,
+            'roles': self.roles,
+            'affiliations': self.affiliations,
+            'contexts': self.contexts,
+            'confidence': self.confidence
+        }
+
+
+@dataclass(slots=True)
+class _MentionGroup:
+    """Running totals for one entity while mentions stream through build_dossiers"""
+    dossier: EntityDossier
+    confidence_sum: float = 0.0
+    raw_names: Set[str] = field(default_factory=set)
+    roles: Set[str] = field(default_factory=set)
+    affiliations: Set[str] = field(default_factory=set)
+
 
 class EntityDossierBuilder:
     """Build structured dossiers from raw entity mentions"""
@@ -60,6 +95,15 @@ class EntityDossierBuilder:
             'P2': ['Propaganda Due'],
         }
 
+        # Flattened alias -> canonical lookups (whitespace-normalized), one per entity type
+        self._alias_maps = {
+            'person': self._invert_aliases(self.person_aliases),
+            'organization': self._invert_aliases(self.org_aliases),
+        }
+
+        # (raw name, entity_type) -> normalized name; surface forms repeat heavily
+        self._norm_cache: Dict[Tuple[str, str], str] = {}
+
         # Role extraction patterns
         self.role_keywords = [
             'director', 'president', 'minister', 'archbishop', 'cardinal',
@@ -67,136 +111,231 @@ class EntityDossierBuilder:
             'chairman', 'founder', 'leader', 'head', 'commander'
         ]
 
-    def normalize_name(self, name: str, entity_type: str) -> str:
-        """Normalize entity name for deduplication"""
-
-        # Check aliases
-        if entity_type == "person":
-            for canonical, aliases in self.person_aliases.items():
-                if name in aliases or name == canonical:
-                    return canonical
+        # Common org names to look for
+        self.affiliation_orgs = [
+            'CIA', 'FBI', 'Vatican', 'NATO', 'OSS', 'P2', 'Mafia',
+            'Opus Dei', 'Red Brigades', 'Mujahideen', 'Al-Qaeda'
+        ]
 
-        elif entity_type == "organization":
-            for canonical, aliases in self.org_aliases.items():
-                if name in aliases or name == canonical:
-                    return canonical
+        # One-pass multi-keyword scanners (None -> per-keyword substring checks)
+        self._role_automaton = self._build_automaton(self.role_keywords)
+        self._org_automaton = self._build_automaton(self.affiliation_orgs)
+
+    @staticmethod
+    def _build_automaton(words: List[str]):
+        """Aho-Corasick automaton reporting each word, or None if unavailable"""
+        if not AHOCORASICK_AVAILABLE:
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for word in words:
+            automaton.add_word(word, word)
+        automaton.make_automaton()
+        return automaton
+
+    @staticmethod
+    def _invert_aliases(aliases: Dict[str, List[str]]) -> Dict[str, str]:
+        """Map every alias (and the canonical name itself) to its canonical name"""
+        lookup = {}
+        for canonical, names in aliases.items():
+            for alias in (*names, canonical):
+                # First canonical listing an alias wins, as in the original scan
+                lookup.setdefault(' '.join(alias.split()), canonical)
+        return lookup
 
-        # Default: clean whitespace
-        return ' '.join(name.split())
+    def normalize_name(self, name: str, entity_type: str) -> str:
+        """Normalize entity name for deduplication"""
+        key = (name, entity_type)
+        normalized = self._norm_cache.get(key)
+        if normalized is not None:
+            return normalized
+
+        # Check aliases (whole-name matches only), default: clean whitespace
+        cleaned = ' '.join(name.split())
+        alias_map = self._alias_maps.get(entity_type)
+        normalized = alias_map.get(cleaned) if alias_map is not None else None
+        if normalized is None:
+            normalized = sys.intern(cleaned)
+
+        self._norm_cache[key] = normalized
+        return normalized
+
+    def scan_roles(self, context: str, roles: Set[str]):
+        """Add role phrases found in one context string to roles"""
+        if self._role_automaton is not None:
+            context_lower = context.lower()
+            phrases = None
+            found = set()
+            for end, keyword in self._role_automaton.iter(context_lower):
+                if keyword in found:
+                    continue
+                found.add(keyword)
+                # Keywords have no '.', so the first hit sits in the first
+                # phrase containing the keyword; count dots to find it
+                if phrases is None:
+                    phrases = context.split('.')
+                phrase_idx = context_lower.count('.', 0, end)
+                roles.add(phrases[phrase_idx].strip()[:100])  # Limit length
+            return
+
+        context_lower = context.lower()
+        phrases = None
+        for keyword in self.role_keywords:
+            if keyword in context_lower:
+                # Split/lower the phrases once per context, not once per keyword
+                if phrases is None:
+                    phrases = context.split('.')
+                    phrases_lower = [phrase.lower() for phrase in phrases]
+
+                # Try to extract fuller role phrase
+                for phrase, phrase_lower in zip(phrases, phrases_lower):
+                    if keyword in phrase_lower:
+                        roles.add(phrase.strip()[:100])  # Limit length
+                        break
+
+    def scan_affiliations(self, context: str, affiliations: Set[str]):
+        """Add organization names found in one context string to affiliations"""
+        if self._org_automaton is not None:
+            affiliations.update(org for _, org in self._org_automaton.iter(context))
+            return
+
+        for org in self.affiliation_orgs:
+            if org in context:
+                affiliations.add(org)
 
     def extract_roles(self, contexts: List[str]) -> List[str]:
         """Extract roles from context strings"""
         roles = set()
-
         for context in contexts:
-            context_lower = context.lower()
-            for keyword in self.role_keywords:
-                if keyword in context_lower:
-                    # Try to extract fuller role phrase
-                    for phrase in context.split('.'):
-                        if keyword in phrase.lower():
-                            roles.add(phrase.strip()[:100])  # Limit length
-                            break
+            self.scan_roles(context, roles)
 
         return list(roles)[:5]  # Top 5 roles
 
     def extract_affiliations(self, contexts: List[str], entity_type: str) -> List[str]:
         """Extract organizational affiliations from contexts"""
         affiliations = set()
-
-        # Common org names to look for
-        org_names = [
-            'CIA', 'FBI', 'Vatican', 'NATO', 'OSS', 'P2', 'Mafia',
-            'Opus Dei', 'Red Brigades', 'Mujahideen', 'Al-Qaeda'
-        ]
-
         for context in contexts:
-            for org in org_names:
-                if org in context:
-                    affiliations.add(org)
+            self.scan_affiliations(context, affiliations)
 
         return list(affiliations)[:10]  # Top 10 affiliations
 
-    def build_dossiers(self, entities: List[Dict]) -> Dict[str, EntityDossier]:
-        """Build consolidated dossiers from raw entity mentions"""
+    def build_dossiers(self, entities: Iterable[Dict]) -> Dict[str, EntityDossier]:
+        """Build consolidated dossiers from raw entity mentions
 
-        # Group mentions by normalized name
-        mentions_by_name = defaultdict(list)
+        Single pass: each mention updates its entity's running totals and is
+        scanned for roles/affiliations as it arrives, so mentions are not kept.
+        """
 
-        for entity in entities:
-            normalized = self.normalize_name(entity['name'], entity['entity_type'])
-            mentions_by_name[(normalized, entity['entity_type'])].append(entity)
+        # entity_type -> normalized name -> running totals for that entity.
+        # Keyed per type so lookups hash just the name, with no tuple per mention;
+        # a person and an organization may still share a name.
+        groups_by_type: Dict[str, Dict[str, _MentionGroup]] = {}
+        ordered_groups: List[_MentionGroup] = []  # first-seen order across types
 
-        # Build dossiers
-        dossiers = {}
+        # Hot loop: bind method/attribute lookups to locals once
+        normalize_name = self.normalize_name
+        scan_roles = self.scan_roles
+        scan_affiliations = self.scan_affiliations
+        get_groups = groups_by_type.get
+        add_group = ordered_groups.append
 
-        for (name, entity_type), mentions in mentions_by_name.items():
-            # Collect all contexts
-            contexts = [m['context'] for m in mentions]
+        for entity in entities:
+            entity_type = entity['entity_type']
+            raw_name = entity['name']
+            line_number = entity['line_number']
+            name = normalize_name(raw_name, entity_type)
+
+            groups = get_groups(entity_type)
+            if groups is None:
+                groups = groups_by_type[entity_type] = {}
+
+            group = groups.get(name)
+            if group is None:
+                group = groups[name] = _MentionGroup(
+                    EntityDossier(name=name, entity_type=entity_type,
+                                  first_appearance_line=line_number)
+                )
+                add_group(group)
+
+            dossier = group.dossier
+            dossier.mention_count += 1
+            if line_number < dossier.first_appearance_line:
+                dossier.first_appearance_line = line_number
+            group.confidence_sum += entity.get('confidence', 0.8)
+            group.raw_names.add(raw_name)
+
+            context = entity['context']
+            contexts = dossier.contexts
+            if len(contexts) < 10:  # Keep top 10 contexts
+                contexts.append(context)
 
-            # Sort mentions by line number to get first appearance
-            mentions_sorted = sorted(mentions, key=lambda m: m['line_number'])
+            # Extract roles and affiliations
+            scan_roles(context, group.roles)
+            scan_affiliations(context, group.affiliations)
 
-            # Build dossier
-            dossier = EntityDossier(
-                name=name,
-                entity_type=entity_type,
-                mention_count=len(mentions),
-                first_appearance_line=mentions_sorted[0]['line_number'],
-                contexts=contexts[:10],  # Keep top 10 contexts
-                confidence=sum(m.get('confidence', 0.8) for m in mentions) / len(mentions)
-            )
+        # Finalize dossiers
+        dossiers = {}
 
-            # Extract roles and affiliations
-            dossier.roles = self.extract_roles(contexts)
-            dossier.affiliations = self.extract_affiliations(contexts, entity_type)
+        for group in ordered_groups:
+            dossier = group.dossier
+            name = dossier.name
+            dossier.confidence = group.confidence_sum / dossier.mention_count
+            dossier.roles = list(group.roles)[:5]  # Top 5 roles
+            dossier.affiliations = list(group.affiliations)[:10]  # Top 10 affiliations
 
             # Collect aliases
-            raw_names = set(m['name'] for m in mentions)
-            dossier.aliases = [n for n in raw_names if n != name]
+            dossier.aliases = [n for n in group.raw_names if n != name]
 
             dossiers[name] = dossier
 
         return dossiers
 
+    def iter_entities(self) -> Iterator[Dict]:
+        """Stream entity dicts from checkpoint files, one batch in memory at a time
+
+        Parsed in-process: a worker pool would only move the decode cost into
+        pickling the entity lists back to this process.
+        """
+        intern = sys.intern
+        for checkpoint_file in checkpoint_files(self.checkpoint_dir):
+            for entity in read_checkpoint(checkpoint_file)['entities']:
+                # Grouped mentions are held until dossiers are built; share the
+                # heavily repeated name/type strings instead of one copy each
+                entity['name'] = intern(entity['name'])
+                entity['entity_type'] = intern(entity['entity_type'])
+                yield entity
+
     def load_entities_from_checkpoints(self) -> List[Dict]:
         """Load all entities from checkpoint files"""
-        all_entities = []
-
-        for checkpoint_file in sorted(self.checkpoint_dir.glob("batch_*.json")):
-            with open(checkpoint_file) as f:
-                data = json.load(f)
-                all_entities.extend(data['entities'])
-
-        return all_entities
+        return list(self.iter_entities())
 
     def save_dossiers(self, dossiers: Dict[str, EntityDossier], output_path: Path):
         """Save dossiers to JSON file"""
 
+        type_counts = Counter(d.entity_type for d in dossiers.values())
+
         dossiers_data = {
             'metadata': {
                 'total_entities': len(dossiers),
-                'people': len([d for d in dossiers.values() if d.entity_type == 'person']),
-                'organizations': len([d for d in dossiers.values() if d.entity_type == 'organization']),
+                'people': type_counts['person'],
+                'organizations': type_counts['organization'],
                 'generated': datetime.now().isoformat()
             },
-            'dossiers': {name: asdict(d) for name, d in dossiers.items()}
+            'dossiers': {name: d.to_dict() for name, d in dossiers.items()}
         }
 
-        with open(output_path, 'w') as f:
-            json.dump(dossiers_data, f, indent=2)
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(dossiers_data, option=orjson.OPT_INDENT_2))
 
         print(f"Saved {len(dossiers)} dossiers to {output_path}")
 
     def process(self, output_path: Path) -> Dict[str, EntityDossier]:
         """Full processing pipeline"""
 
-        print(f"Loading entities from {self.checkpoint_dir}...")
-        entities = self.load_entities_from_checkpoints()
-        print(f"  Loaded {len(entities)} entity mentions")
-
-        print("Building dossiers...")
-        dossiers = self.build_dossiers(entities)
+        # Checkpoints stream straight into grouping; no flat mention list is kept
+        print(f"Loading entities from {self.checkpoint_dir} and building dossiers...")
+        dossiers = self.build_dossiers(self.iter_entities())
+        print(f"  Loaded {sum(d.mention_count for d in dossiers.values())} entity mentions")
         print(f"  Created {len(dossiers)} unique entities")
 
         print("Saving dossiers...")
@@ -226,7 +365,7 @@ def main():
     print("TOP PEOPLE (by mention count):")
     print("="*60)
 
-    top_people = sorted(people.items(), key=lambda x: x[1].mention_count, reverse=True)[:15]
+    top_people = heapq.nlargest(15, people.items(), key=lambda x: x[1].mention_count)
     for name, dossier in top_people:
         print(f"\n{name}")
         print(f"  Mentions: {dossier.mention_count}")
@@ -237,7 +376,7 @@ def main():
     print("TOP ORGANIZATIONS (by mention count):")
     print("="*60)
 
-    top_orgs = sorted(orgs.items(), key=lambda x: x[1].mention_count, reverse=True)[:15]
+    top_orgs = heapq.nlargest(15, orgs.items(), key=lambda x: x[1].mention_count)
     for name, dossier in top_orgs:
         print(f"\n{name}")
         print(f"  Mentions: {dossier.mention_count}")
@@ -8,11 +8,14 @@ Memory: <200MB
 Output: Markdown reports and JSON summaries
 """
 
-import json
+import heapq
+from collections import Counter, defaultdict
 from pathlib import Path
 from typing import Dict, List
 from datetime import datetime
 
+import orjson
+
 
 class IntelligenceReportGenerator:
     """Generate intelligence reports from all analysis results"""
@@ -27,33 +30,60 @@ class IntelligenceReportGenerator:
         self.timeline = self.load_json('timeline.json')
         self.network_metrics = self.load_json('network_metrics.json')
 
+        # Rank dossiers once; markdown (top 15/15) and JSON (top 20/10) slice these
+        self._top_people, self._top_orgs = self.rank_dossiers(people_n=20, orgs_n=15)
+
     def load_json(self, filename: str) -> Dict:
         """Load JSON file"""
         filepath = self.data_dir / filename
         if filepath.exists():
-            with open(filepath) as f:
-                return json.load(f)
+            with open(filepath, 'rb') as f:
+                return orjson.loads(f.read())
         return {}
 
+    def rank_dossiers(self, people_n: int, orgs_n: int):
+        """Top (name, dossier) pairs by mention count for people and organizations"""
+        people = []
+        orgs = []
+        for item in self.entities.get('dossiers', {}).items():
+            entity_type = item[1].get('entity_type')
+            if entity_type == 'person':
+                people.append(item)
+            elif entity_type == 'organization':
+                orgs.append(item)
+
+        def by_mentions(item):
+            return item[1].get('mention_count', 0)
+
+        return heapq.nlargest(people_n, people, key=by_mentions), heapq.nlargest(orgs_n, orgs, key=by_mentions)
+
     def generate_executive_summary(self) -> str:
         """Generate executive summary"""
 
-        total_entities = self.entities.get('metadata', {}).get('total_entities', 0)
-        people_count = self.entities.get('metadata', {}).get('people', 0)
-        orgs_count = self.entities.get('metadata', {}).get('organizations', 0)
+        entities_meta = self.entities.get('metadata') or {}
+        rel_meta = self.relationships.get('metadata') or {}
+        flow_meta = self.resource_flows.get('metadata') or {}
+        timeline_meta = self.timeline.get('metadata') or {}
+        net_size = self.network_metrics.get('network_size') or {}
+        top_nodes = (self.network_metrics.get('centrality') or {}).get('top_10_nodes')
 
-        total_relationships = self.relationships.get('metadata', {}).get('total_relationships', 0)
+        total_entities = entities_meta.get('total_entities', 0)
+        people_count = entities_meta.get('people', 0)
+        orgs_count = entities_meta.get('organizations', 0)
 
-        total_flows = self.resource_flows.get('metadata', {}).get('total_flows', 0)
-        money_flows = self.resource_flows.get('metadata', {}).get('money_flows', 0)
-        weapons_flows = self.resource_flows.get('metadata', {}).get('weapons_flows', 0)
+        total_relationships = rel_meta.get('total_relationships', 0)
 
-        total_events = self.timeline.get('metadata', {}).get('total_events', 0)
-        earliest_year = self.timeline.get('metadata', {}).get('earliest_year', 'Unknown')
-        latest_year = self.timeline.get('metadata', {}).get('latest_year', 'Unknown')
+        total_flows = flow_meta.get('total_flows', 0)
+        money_flows = flow_meta.get('money_flows', 0)
+        weapons_flows = flow_meta.get('weapons_flows', 0)
 
-        network_nodes = self.network_metrics.get('network_size', {}).get('total_nodes', 0)
-        network_edges = self.network_metrics.get('network_size', {}).get('total_edges', 0)
+        total_events = timeline_meta.get('total_events', 0)
+        earliest_year = timeline_meta.get('earliest_year', 'Unknown')
+        latest_year = timeline_meta.get('latest_year', 'Unknown')
+
+        network_nodes = net_size.get('total_nodes', 0)
+        network_edges = net_size.get('total_edges', 0)
+        hub_connections = top_nodes[0][1] if top_nodes else 'N/A'
 
         summary = f"""# Operation Gladio Intelligence Analysis
 ## Executive Summary
@@ -79,7 +109,7 @@ This analysis reveals a complex network of {total_entities} entities ({people_co
 **Network Analysis:**
 - **{network_nodes} key nodes** in primary network
 - **{network_edges:,} connections** mapping power structures
-- Central hub: CIA ({self.network_metrics.get('centrality', {}).get('top_10_nodes', [[]])[0][1] if self.network_metrics.get('centrality', {}).get('top_10_nodes') else 'N/A'} connections)
+- Central hub: CIA ({hub_connections} connections)
 
 """
         return summary
@@ -87,40 +117,34 @@ This analysis reveals a complex network of {total_entities} entities ({people_co
     def generate_top_entities_report(self) -> str:
         """Generate top entities section"""
 
-        dossiers = self.entities.get('dossiers', {})
-
-        # Get people sorted by mentions
-        people = [(name, data) for name, data in dossiers.items() if data.get('entity_type') == 'person']
-        people_sorted = sorted(people, key=lambda x: x[1].get('mention_count', 0), reverse=True)
+        # Top people and organizations by mentions (ranked once in __init__)
+        people_sorted = self._top_people[:15]
+        orgs_sorted = self._top_orgs[:15]
 
-        # Get organizations sorted by mentions
-        orgs = [(name, data) for name, data in dossiers.items() if data.get('entity_type') == 'organization']
-        orgs_sorted = sorted(orgs, key=lambda x: x[1].get('mention_count', 0), reverse=True)
-
-        report = """### Top 15 Most Referenced Individuals
+        parts = ["""### Top 15 Most Referenced Individuals
 
 | Name | Mentions | Affiliations | Key Roles |
 |------|----------|--------------|-----------|
-"""
+"""]
 
-        for name, data in people_sorted[:15]:
+        for name, data in people_sorted:
             mentions = data.get('mention_count', 0)
             affiliations = ', '.join(data.get('affiliations', [])[:3])
             roles = ', '.join(r[:50] for r in data.get('roles', [])[:2])
-            report += f"| {name} | {mentions} | {affiliations} | {roles[:60]}{'...' if len(roles) > 60 else ''} |\n"
+            parts.append(f"| {name} | {mentions} | {affiliations} | {roles[:60]}{'...' if len(roles) > 60 else ''} |\n")
 
-        report += """\n### Top 15 Most Referenced Organizations
+        parts.append("""\n### Top 15 Most Referenced Organizations
 
 | Name | Mentions | Type | Aliases |
 |------|----------|------|---------|
-"""
+""")
 
-        for name, data in orgs_sorted[:15]:
+        for name, data in orgs_sorted:
             mentions = data.get('mention_count', 0)
             aliases = ', '.join(data.get('aliases', [])[:3])
-            report += f"| {name} | {mentions} | Organization | {aliases} |\n"
+            parts.append(f"| {name} | {mentions} | Organization | {aliases} |\n")
 
-        return report
+        return ''.join(parts)
 
     def generate_network_analysis(self) -> str:
         """Generate network analysis section"""
@@ -128,81 +152,74 @@ This analysis reveals a complex network of {total_entities} entities ({people_co
         top_nodes = self.network_metrics.get('centrality', {}).get('top_10_nodes', [])
         rel_types = self.network_metrics.get('relationship_types', {})
 
-        report = """### Network Centrality Analysis
+        parts = ["""### Network Centrality Analysis
 
 **Most Connected Entities (Network Hubs):**
 
 | Entity | Connections | Role in Network |
 |--------|-------------|-----------------|
-"""
+"""]
 
         for node, connections in top_nodes[:10]:
-            report += f"| {node} | {connections} | Network Hub |\n"
+            parts.append(f"| {node} | {connections} | Network Hub |\n")
 
-        report += """\n### Relationship Distribution
+        parts.append("""\n### Relationship Distribution
 
 | Relationship Type | Count | Percentage |
 |-------------------|-------|------------|
-"""
+""")
 
         total_rels = sum(rel_types.values()) if rel_types else 1
 
         for rel_type, count in sorted(rel_types.items(), key=lambda x: x[1], reverse=True):
             percentage = (count / total_rels) * 100
-            report += f"| {rel_type.capitalize()} | {count} | {percentage:.1f}% |\n"
+            parts.append(f"| {rel_type.capitalize()} | {count} | {percentage:.1f}% |\n")
 
-        return report
+        return ''.join(parts)
 
     def generate_timeline_summary(self) -> str:
         """Generate timeline summary"""
 
         timeline_events = self.timeline.get('timeline', [])
 
-        # Group by decade
-        by_decade = {}
+        # Count events and involved entities per decade in one pass
+        by_decade = defaultdict(lambda: [0, Counter()])
         for event in timeline_events:
             year = event.get('year')
             if year and isinstance(year, int):
-                decade = (year // 10) * 10
-                if decade not in by_decade:
-                    by_decade[decade] = []
-                by_decade[decade].append(event)
+                decade_stats = by_decade[(year // 10) * 10]
+                decade_stats[0] += 1
+                decade_stats[1].update(event.get('entities_involved', ()))
 
-        report = """### Historical Timeline
+        parts = ["""### Historical Timeline
 
 **Events by Decade:**
 
 | Period | Event Count | Key Focus Areas |
 |--------|-------------|-----------------|
-"""
+"""]
 
         for decade in sorted(by_decade.keys()):
-            events = by_decade[decade]
+            event_count, entity_freq = by_decade[decade]
             # Get most common entities
-            entity_freq = {}
-            for event in events:
-                for entity in event.get('entities_involved', []):
-                    entity_freq[entity] = entity_freq.get(entity, 0) + 1
+            focus = ', '.join(entity for entity, _ in entity_freq.most_common(3))
 
-            top_entities = sorted(entity_freq.items(), key=lambda x: x[1], reverse=True)[:3]
-            focus = ', '.join(e[0] for e in top_entities)
+            parts.append(f"| {decade}s | {event_count} | {focus} |\n")
 
-            report += f"| {decade}s | {len(events)} | {focus} |\n"
-
-        return report
+        return ''.join(parts)
 
     def generate_resource_flow_analysis(self) -> str:
         """Generate resource flow analysis"""
 
         flows_by_type = self.resource_flows.get('flows_by_type', {})
 
-        report = """### Resource Flow Analysis
+        parts = ["""### Resource Flow Analysis
 
 **Resource Transfer Summary:**
 
 | Resource Type | Flows Identified | Notable Patterns |
 |---------------|------------------|------------------|
-"""
+"""]
 
         for resource_type, flows in flows_by_type.items():
             count = len(flows)
@@ -215,24 +232,27 @@ This analysis reveals a complex network of {total_entities} entities ({people_co
 
             top_source = max(sources.items(), key=lambda x: x[1])[0] if sources else 'N/A'
 
-            report += f"| {resource_type.capitalize()} | {count:,} | Primary source: {top_source} |\n"
+            parts.append(f"| {resource_type.capitalize()} | {count:,} | Primary source: {top_source} |\n")
 
-        return report
+        return ''.join(parts)
 
     def generate_full_report(self, output_path: Path):
         """Generate full markdown report"""
 
-        report = self.generate_executive_summary()
-        report += "\n---\n\n"
-        report += self.generate_top_entities_report()
-        report += "\n---\n\n"
-        report += self.generate_network_analysis()
-        report += "\n---\n\n"
-        report += self.generate_timeline_summary()
-        report += "\n---\n\n"
-        report += self.generate_resource_flow_analysis()
-
-        report += """\n---\n
+        # Collect all sections and join once
+        parts = [
+            self.generate_executive_summary(),
+            "\n---\n\n",
+            self.generate_top_entities_report(),
+            "\n---\n\n",
+            self.generate_network_analysis(),
+            "\n---\n\n",
+            self.generate_timeline_summary(),
+            "\n---\n\n",
+            self.generate_resource_flow_analysis(),
+        ]
+
+        parts.append("""\n---\n
 ## Methodology
 
 This intelligence analysis was generated through automated processing of the Operation Gladio audiobook transcript using:
@@ -260,25 +280,21 @@ This intelligence analysis was generated through automated processing of the Ope
 **Generated:** """ + datetime.now().strftime('%Y-%m-%d %H:%M:%S') + """
 **System:** Sherlock Evidence Analysis System
 **Source:** Operation Gladio: The Unholy Alliance Between the Vatican, the CIA, and the Mafia (Paul L. Williams)
-"""
+""")
 
-        with open(output_path, 'w') as f:
-            f.write(report)
+        # Encode once and hand the whole report to a single write
+        Path(output_path).write_bytes(''.join(parts).encode('utf-8'))
 
         print(f"Saved full report to {output_path}")
 
     def generate_json_summary(self, output_path: Path):
         """Generate JSON summary of top entities"""
 
-        dossiers = self.entities.get('dossiers', {})
-
-        # Get top 20 people
-        people = [(name, data) for name, data in dossiers.items() if data.get('entity_type') == 'person']
-        people_sorted = sorted(people, key=lambda x: x[1].get('mention_count', 0), reverse=True)[:20]
+        timeline_meta = self.timeline.get('metadata') or {}
 
-        # Get top 10 organizations
-        orgs = [(name, data) for name, data in dossiers.items() if data.get('entity_type') == 'organization']
-        orgs_sorted = sorted(orgs, key=lambda x: x[1].get('mention_count', 0), reverse=True)[:10]
+        # Get top 20 people and top 10 organizations
+        people_sorted = self._top_people[:20]
+        orgs_sorted = self._top_orgs[:10]
 
         summary = {
             'analysis_date': datetime.now().isoformat(),
@@ -301,14 +317,14 @@ This intelligence analysis was generated through automated processing of the Ope
             ],
             'network_hubs': self.network_metrics.get('centrality', {}).get('top_10_nodes', [])[:10],
             'timeline_span': {
-                'earliest': self.timeline.get('metadata', {}).get('earliest_year'),
-                'latest': self.timeline.get('metadata', {}).get('latest_year'),
-                'total_events': self.timeline.get('metadata', {}).get('total_events', 0)
+                'earliest': timeline_meta.get('earliest_year'),
+                'latest': timeline_meta.get('latest_year'),
+                'total_events': timeline_meta.get('total_events', 0)
             }
         }
 
-        with open(output_path, 'w') as f:
-            json.dump(summary, f, indent=2)
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
 
         print(f"Saved JSON summary to {output_path}")
 
@@ -8,13 +8,57 @@ Memory: <200MB
 Output: DOT format + auto-generated PNG/SVG/PDF (if GraphViz available)
 """
 
+import heapq
 import json
 import subprocess
 import shutil
+import sys
 from pathlib import Path
-from typing import Dict, List, Set
-from collections import defaultdict, Counter
+from typing import Dict, List, Set, Iterator
+from array import array
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property
+
+import orjson
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# GraphViz lookup (one PATH scan per run)
+HAS_DOT = shutil.which('dot') is not None
+
+
+def accumulate_degrees(degrees: array, src_ids: array, dst_ids: array, weights: array):
+    """Add each edge's weight to the degree of both endpoints (in place)"""
+    if NUMPY_AVAILABLE:
+        # Zero-copy int64 views over the array('q') buffers; one C-level scatter-add per side
+        deg = np.frombuffer(degrees, dtype=np.int64)
+        w = np.frombuffer(weights, dtype=np.int64)
+        np.add.at(deg, np.frombuffer(src_ids, dtype=np.int64), w)
+        np.add.at(deg, np.frombuffer(dst_ids, dtype=np.int64), w)
+    else:
+        for source, target, weight in zip(src_ids, dst_ids, weights):
+            degrees[source] += weight
+            degrees[target] += weight
+
+
+def capped_scale(values: List[float], base: float, divisor: float, cap: float) -> List[float]:
+    """min(cap, base + value / divisor) for every value"""
+    if NUMPY_AVAILABLE:
+        scaled = np.minimum(cap, base + np.fromiter(values, dtype=np.float64, count=len(values)) / divisor)
+        return scaled.tolist()
+    return [min(cap, base + (value / divisor)) for value in values]
 
 
 class NetworkGraphBuilder:
@@ -24,143 +68,198 @@ class NetworkGraphBuilder:
         self.relationships_path = Path(relationships_path)
         self.entities_path = Path(entities_path)
 
-        # Load data
-        self.relationships = self.load_relationships()
-        self.entities = self.load_entities()
-
-        # Network structures
-        self.nodes = set()
-        self.edges = []
-        self.node_types = {}
-        self.node_connections = defaultdict(int)
+        # Network structures: each entity gets a small integer ID at ingest and
+        # per-node data lives in columns indexed by it
+        self.node_ids = {}           # name -> ID
+        self.node_names = []         # ID -> name
+        self.node_types = []         # ID -> type (last seen)
+        self.type_counts = Counter()  # type -> node count, kept live during ingest
+        self.degrees = array('q')    # ID -> summed mention count
+        # Edge weights summed per (source, target) pair during ingest, one
+        # {target ID: weight} dict per source ID so a node's outgoing edges
+        # can be visited directly
+        self.edge_weight_map = []
+        self.edge_count = 0
+
+        # Relationship type histogram, kept live during ingest
+        self.rel_type_counts = Counter()
+
+        # Largest top-N ranking (node IDs) computed so far; smaller requests slice it
+        self._top_ids = []
+        self._top_ids_n = 0
+
+    def iter_relationships(self) -> Iterator[Dict]:
+        """Stream relationships from JSON (incremental parse when ijson is available)"""
+        with open(self.relationships_path, 'rb') as f:
+            if IJSON_AVAILABLE:
+                yield from ijson.items(f, 'relationships.item', use_float=True)
+            else:
+                yield from orjson.loads(f.read())['relationships']
 
     def load_relationships(self) -> List[Dict]:
         """Load relationships from JSON"""
-        with open(self.relationships_path) as f:
-            data = json.load(f)
-        return data['relationships']
+        return list(self.iter_relationships())
+
+    @cached_property
+    def entities(self) -> Dict:
+        """Entity dossiers, loaded on first access (nothing in the graph build needs them)"""
+        return self.load_entities()
 
     def load_entities(self) -> Dict:
         """Load entities from JSON"""
-        with open(self.entities_path) as f:
-            data = json.load(f)
+        with open(self.entities_path, 'rb') as f:
+            data = orjson.loads(f.read())
         return data['dossiers']
 
+    def _node_id(self, name: str, node_type: str) -> int:
+        """ID for an entity, registering it on first sight; records its latest type"""
+        node_id = self.node_ids.get(name)
+        if node_id is None:
+            node_id = self.node_ids[name] = len(self.node_names)
+            self.node_names.append(name)
+            self.node_types.append(node_type)
+            self.degrees.append(0)
+            self.edge_weight_map.append({})
+            self.type_counts[node_type] += 1
+        else:
+            previous_type = self.node_types[node_id]
+            if previous_type != node_type:
+                # Later mention retypes the node; move it between buckets
+                self.node_types[node_id] = node_type
+                self.type_counts[previous_type] -= 1
+                self.type_counts[node_type] += 1
+        return node_id
+
     def build_network(self):
         """Build network from relationships"""
 
         print("Building network graph...")
 
-        for rel in self.relationships:
-            entity1 = rel['entity_1']
-            entity2 = rel['entity_2']
-            entity1_type = rel['entity_1_type']
-            entity2_type = rel['entity_2_type']
-            rel_type = rel['relationship_type']
+        # Degrees are about to change
+        self._top_ids = []
+        self._top_ids_n = 0
+
+        # Intern at ingest: each name/type is then one shared str across the
+        # ID map and node columns
+        intern = sys.intern
+        node_id = self._node_id
+        edge_weight_map = self.edge_weight_map
+
+        # Endpoint IDs and weights for this pass; degrees are summed in bulk afterwards
+        src_ids = array('q')
+        dst_ids = array('q')
+        weights = array('q')
+
+        for rel in self.iter_relationships():
+            entity1 = intern(rel['entity_1'])
+            entity2 = intern(rel['entity_2'])
+            entity1_type = intern(rel['entity_1_type'])
+            entity2_type = intern(rel['entity_2_type'])
+            rel_type = intern(rel['relationship_type'])
             mention_count = rel['mention_count']
 
-            # Add nodes
-            self.nodes.add(entity1)
-            self.nodes.add(entity2)
-
-            # Track node types
-            self.node_types[entity1] = entity1_type
-            self.node_types[entity2] = entity2_type
+            # Add nodes and track their types
+            source = node_id(entity1, entity1_type)
+            target = node_id(entity2, entity2_type)
 
             # Add edge
-            self.edges.append({
-                'source': entity1,
-                'target': entity2,
-                'type': rel_type,
-                'weight': mention_count
-            })
+            out_edges = edge_weight_map[source]
+            out_edges[target] = out_edges.get(target, 0) + mention_count
+            self.edge_count += 1
+            self.rel_type_counts[rel_type] += 1
 
             # Track connections
-            self.node_connections[entity1] += mention_count
-            self.node_connections[entity2] += mention_count
+            src_ids.append(source)
+            dst_ids.append(target)
+            weights.append(mention_count)
+
+        accumulate_degrees(self.degrees, src_ids, dst_ids, weights)
 
-        print(f"  Nodes: {len(self.nodes)}")
-        print(f"  Edges: {len(self.edges)}")
+        print(f"  Nodes: {len(self.node_names)}")
+        print(f"  Edges: {self.edge_count}")
 
     def calculate_centrality(self) -> Dict[str, int]:
         """Calculate node centrality (degree centrality)"""
-        return dict(self.node_connections)
+        return dict(zip(self.node_names, self.degrees))
+
+    def top_node_ids(self, n: int = 20) -> List[int]:
+        """IDs of the top N most connected nodes"""
+        if n > self._top_ids_n:
+            self._top_ids = heapq.nlargest(n, range(len(self.degrees)), key=self.degrees.__getitem__)
+            self._top_ids_n = n
+        return self._top_ids[:n]
 
     def get_top_nodes(self, n: int = 20) -> List[tuple]:
         """Get top N most connected nodes"""
-        centrality = self.calculate_centrality()
-        sorted_nodes = sorted(centrality.items(), key=lambda x: x[1], reverse=True)
-        return sorted_nodes[:n]
+        return [(self.node_names[i], self.degrees[i]) for i in self.top_node_ids(n)]
 
     def generate_dot_file(self, output_path: Path, top_n: int = 50):
         """Generate GraphViz DOT file"""
 
         # Get top nodes to limit graph size
+        top_ids = self.top_node_ids(top_n)
+        top_ids_set = set(top_ids)
         top_nodes_list = self.get_top_nodes(top_n)
-        top_nodes_set = set(node for node, _ in top_nodes_list)
+        names = self.node_names
 
-        # Filter edges to only include top nodes
+        # Filter (already aggregated) edges to only include top nodes; only
+        # edges leaving a top node can qualify, so walk just those
         filtered_edges = [
-            e for e in self.edges
-            if e['source'] in top_nodes_set and e['target'] in top_nodes_set
+            (names[source], names[target], weight)
+            for source in top_ids
+            for target, weight in self.edge_weight_map[source].items()
+            if target in top_ids_set
         ]
 
         print(f"\nGenerating DOT file with top {top_n} nodes...")
         print(f"  Filtered edges: {len(filtered_edges)}")
 
-        with open(output_path, 'w') as f:
-            f.write("digraph GladioNetwork {\n")
-            f.write("  rankdir=LR;\n")
-            f.write("  node [fontname=\"Arial\"];\n")
-            f.write("  edge [fontname=\"Arial\"];\n\n")
-
-            # Add nodes with styling
-            for node in top_nodes_set:
-                node_type = self.node_types.get(node, "unknown")
-                connections = self.node_connections.get(node, 0)
-
-                # Size based on connections
-                size = min(3.0, 0.5 + (connections / 50))
-
-                # Color based on type
-                if node_type == "person":
-                    color = "lightblue"
-                    shape = "ellipse"
-                else:
-                    color = "lightcoral"
-                    shape = "box"
-
-                # Clean node name for DOT format
-                clean_name = node.replace('"', '\\"')
-
-                f.write(f'  "{clean_name}" [')
-                f.write(f'shape={shape}, ')
-                f.write(f'style=filled, ')
-                f.write(f'fillcolor={color}, ')
-                f.write(f'width={size:.2f}, ')
-                f.write(f'height={size:.2f}')
-                f.write('];\n')
-
-            f.write("\n")
-
-            # Add edges
-            edge_counts = Counter()
-            for edge in filtered_edges:
-                key = (edge['source'], edge['target'])
-                edge_counts[key] += edge['weight']
-
-            for (source, target), weight in edge_counts.items():
-                clean_source = source.replace('"', '\\"')
-                clean_target = target.replace('"', '\\"')
-
-                # Edge thickness based on weight
-                penwidth = min(5.0, 1.0 + (weight / 10))
-
-                f.write(f'  "{clean_source}" -> "{clean_target}" [')
-                f.write(f'penwidth={penwidth:.1f}')
-                f.write('];\n')
-
-            f.write("}\n")
+        parts = [
+            "digraph GladioNetwork {\n",
+            "  rankdir=LR;\n",
+            "  node [fontname=\"Arial\"];\n",
+            "  edge [fontname=\"Arial\"];\n\n",
+        ]
+
+        # Size based on connections, thickness based on weight (whole batch at once)
+        sizes = capped_scale([connections for _, connections in top_nodes_list], 0.5, 50, 3.0)
+        penwidths = capped_scale([weight for _, _, weight in filtered_edges], 1.0, 10, 5.0)
+
+        # Add nodes with styling
+        node_types = self.node_types
+        for node_id, (node, _), size in zip(top_ids, top_nodes_list, sizes):
+            node_type = node_types[node_id]
+
+            # Color based on type
+            if node_type == "person":
+                color = "lightblue"
+                shape = "ellipse"
+            else:
+                color = "lightcoral"
+                shape = "box"
+
+            # Clean node name for DOT format
+            clean_name = node.replace('"', '\\"')
+
+            parts.append(
+                f'  "{clean_name}" [shape={shape}, style=filled, '
+                f'fillcolor={color}, width={size:.2f}, height={size:.2f}];\n'
+            )
+
+        parts.append("\n")
+
+        # Add edges
+        for (source, target, _), penwidth in zip(filtered_edges, penwidths):
+            clean_source = source.replace('"', '\\"')
+            clean_target = target.replace('"', '\\"')
+
+            parts.append(f'  "{clean_source}" -> "{clean_target}" [penwidth={penwidth:.1f}];\n')
+
+        parts.append("}\n")
+
+        # One buffered write for the whole graph
+        with open(output_path, 'w', buffering=1 << 20) as f:
+            f.writelines(parts)
 
         print(f"Saved DOT file to {output_path}")
 
@@ -168,30 +267,23 @@ class NetworkGraphBuilder:
         """Calculate network metrics"""
 
         # Degree distribution
-        degrees = list(self.node_connections.values())
+        degrees = self.degrees
         avg_degree = sum(degrees) / len(degrees) if degrees else 0
         max_degree = max(degrees) if degrees else 0
 
-        # Node type distribution
-        type_counts = Counter(self.node_types.values())
-
-        # Relationship type distribution
-        rel_types = [e['type'] for e in self.edges]
-        rel_type_counts = Counter(rel_types)
-
         metrics = {
             'network_size': {
-                'total_nodes': len(self.nodes),
-                'total_edges': len(self.edges),
-                'people': type_counts.get('person', 0),
-                'organizations': type_counts.get('organization', 0)
+                'total_nodes': len(self.node_names),
+                'total_edges': self.edge_count,
+                'people': self.type_counts.get('person', 0),
+                'organizations': self.type_counts.get('organization', 0)
             },
             'centrality': {
                 'average_degree': avg_degree,
                 'max_degree': max_degree,
                 'top_10_nodes': self.get_top_nodes(10)
             },
-            'relationship_types': dict(rel_type_counts),
+            'relationship_types': dict(self.rel_type_counts),
             'generated': datetime.now().isoformat()
         }
 
@@ -208,7 +300,7 @@ class NetworkGraphBuilder:
         """Generate PNG, SVG, and PDF from DOT file if GraphViz available"""
 
         # Check if GraphViz is installed
-        if not shutil.which('dot'):
+        if not HAS_DOT:
             print("\n⚠️  GraphViz not installed - skipping image generation")
             print("   Install with: sudo apt-get install graphviz")
             return
@@ -221,26 +313,33 @@ class NetworkGraphBuilder:
 
         print(f"\n📊 Generating network visualizations...")
 
-        for fmt, description in formats.items():
+        def render(fmt: str) -> Path:
             output_path = output_dir / f"gladio_network.{fmt}"
+            subprocess.run([
+                'dot',
+                f'-T{fmt}',
+                str(dot_path),
+                '-o', str(output_path)
+            ], check=True, capture_output=True, timeout=60)
+            return output_path
+
+        # Each format is an independent dot process; run them side by side
+        with ThreadPoolExecutor(max_workers=len(formats)) as pool:
+            futures = {fmt: pool.submit(render, fmt) for fmt in formats}
 
-            try:
-                subprocess.run([
-                    'dot',
-                    f'-T{fmt}',
-                    str(dot_path),
-                    '-o', str(output_path)
-                ], check=True, capture_output=True, timeout=60)
+            for fmt, description in formats.items():
+                try:
+                    output_path = futures[fmt].result()
 
-                file_size = output_path.stat().st_size / (1024 * 1024)  # MB
-                print(f"  ✅ {fmt.upper()}: {output_path.name} ({file_size:.1f}MB - {description})")
+                    file_size = output_path.stat().st_size / (1024 * 1024)  # MB
+                    print(f"  ✅ {fmt.upper()}: {output_path.name} ({file_size:.1f}MB - {description})")
 
-            except subprocess.CalledProcessError as e:
-                print(f"  ❌ Failed to generate {fmt}: {e.stderr.decode()}")
-            except subprocess.TimeoutExpired:
-                print(f"  ❌ Timeout generating {fmt} (>60s)")
-            except Exception as e:
-                print(f"  ❌ Error generating {fmt}: {e}")
+                except subprocess.CalledProcessError as e:
+                    print(f"  ❌ Failed to generate {fmt}: {e.stderr.decode()}")
+                except subprocess.TimeoutExpired:
+                    print(f"  ❌ Timeout generating {fmt} (>60s)")
+                except Exception as e:
+                    print(f"  ❌ Error generating {fmt}: {e}")
 
 
 def main():
@@ -289,7 +388,7 @@ def main():
 
     print(f"\n✅ Network analysis complete!")
     print(f"   DOT source: {dot_output_path.name}")
-    if shutil.which('dot'):
+    if HAS_DOT:
         print(f"   Images: gladio_network.{{png,svg,pdf}}")
     else:
         print("   To generate images: dot -Tpng gladio_network.dot -o gladio_network.png")
@@ -14,18 +14,58 @@ import sys
 import json
 import time
 import logging
+import re
+import queue
 import subprocess
+import threading
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Dict, Iterator, Optional, Set, Tuple
 from datetime import datetime
 
+import numpy as np
+
 # Import Sherlock components - using established architecture
-from voice_engine import VoiceEngineManager, VoiceProcessingRequest, TranscriptionMode, ProcessingPriority
+from voice_engine import VoiceEngineManager, TranscriptionMode, FASTER_WHISPER_AVAILABLE
 from evidence_schema_gladio import (
-    GladioEvidenceDatabase, PersonDossier, Organization,
+    GladioEvidenceDatabase, PersonDossier, Organization, entity_id,
     Evidence, Claim, TimeReference, EvidenceType, ConfidenceLevel
 )
 
+try:
+    from faster_whisper import BatchedInferencePipeline
+    BATCHED_PIPELINE_AVAILABLE = True
+except ImportError:
+    BATCHED_PIPELINE_AVAILABLE = False
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# People and organizations in one alternation, scanned in a single pass.
+# Known organizations (whole words, any case) are tried first so names like
+# "Opus Dei" are classified once; titled and "Delle" forms precede First Last.
+# RE2, when installed, scans in linear time with a DFA instead of backtracking.
+ENTITY_RE = (re2 if RE2_AVAILABLE else re).compile(
+    r'(?P<org>\b(?i:CIA|Vatican|Mafia|P-2|P2|Propaganda Due|Knights of Malta|Opus Dei|'
+    r'Banco Ambrosiano|IOR|Gladio|NATO|OSS|Ordine Nuovo|Avanguardia Nazionale)\b)'
+    r'|(?P<person>General [A-Z][a-z]+|Colonel [A-Z][a-z]+|Cardinal [A-Z][a-z]+|'
+    r'Pope [A-Z][a-z]+ [IVX]+|[A-Z][a-z]+ Delle [A-Z][a-z]+|[A-Z][a-z]+ [A-Z][a-z]+)'
+)
+
+
+def _extract_chunk_worker(text: str) -> Tuple[Set[str], Set[str]]:
+    """People and organization names found in one chunk"""
+    people_found = set()
+    orgs_found = set()
+    for match in ENTITY_RE.finditer(text):
+        if match.lastgroup == 'person':
+            people_found.add(match.group())
+        else:
+            orgs_found.add(match.group())
+    return people_found, orgs_found
+
 
 class GladioProcessorV2(VoiceEngineManager):
     """
@@ -33,6 +73,19 @@ class GladioProcessorV2(VoiceEngineManager):
     Follows established dual-engine architecture with corrected database API calls
     """
 
+    # English-only distilled model (CTranslate2 format): ~2x tiny's throughput at lower WER
+    FAST_MODEL_ID = "Systran/faster-distil-whisper-small.en"
+    FAST_MODEL_KEY = "faster_whisper_distil_small_en"
+
+    # 30s windows decoded together per batched model call
+    BATCH_SIZE = 16
+
+    # Whisper input: 16kHz mono
+    SAMPLE_RATE = 16000
+
+    # Only speech is transcribed; pauses of 500ms+ split the voiced regions
+    VAD_PARAMETERS = dict(min_silence_duration_ms=500)
+
     def __init__(self):
         # Initialize parent VoiceEngineManager with system constraints
         super().__init__(max_ram_gb=3.7)
@@ -54,6 +107,53 @@ class GladioProcessorV2(VoiceEngineManager):
         logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
         self.logger = logging.getLogger(__name__)
 
+        # Batched faster-whisper pipeline, built once the FAST model is loaded
+        self.pipeline = None
+
+        # Entities already in the database or written earlier this run; their
+        # dossiers are neither rebuilt nor overwritten by later chunks
+        self._seen_people = self.evidence_db.person_ids()
+        self._seen_orgs = self.evidence_db.organization_ids()
+
+    def _load_model(self, mode: TranscriptionMode) -> bool:
+        """
+        Load the FAST model quantized for the available device (other modes use the parent loader)
+        """
+        if mode != TranscriptionMode.FAST:
+            return super()._load_model(mode)
+        if self.FAST_MODEL_KEY in self.models:
+            return True
+
+        if not FASTER_WHISPER_AVAILABLE:
+            self.logger.error("faster-whisper not available")
+            return False
+
+        from faster_whisper import WhisperModel
+
+        # CTranslate2 quantizes at load: int8 weights on CPU, int8 weights with fp16 compute on CUDA
+        device, compute_type = "cpu", "int8"
+        try:
+            import ctranslate2
+            if ctranslate2.get_cuda_device_count() > 0:
+                device, compute_type = "cuda", "int8_float16"
+        except Exception:
+            pass
+
+        self.logger.info(f"Loading {self.FAST_MODEL_ID} ({device}, {compute_type})")
+        try:
+            self.models[self.FAST_MODEL_KEY] = WhisperModel(
+                self.FAST_MODEL_ID,
+                device=device,
+                compute_type=compute_type,
+                cpu_threads=os.cpu_count() or 0,
+                num_workers=2
+            )
+            self.logger.info(f"{self.FAST_MODEL_ID} loaded successfully")
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to load {self.FAST_MODEL_ID}: {e}")
+            return False
+
     def process_gladio_audiobook(self, aaxc_file: str) -> bool:
         """
         Process Operation Gladio audiobook using VoiceEngineManager architecture
@@ -65,56 +165,49 @@ class GladioProcessorV2(VoiceEngineManager):
             self.logger.info("📊 Using VoiceEngineManager dual-engine architecture")
             self.logger.info("✅ Validation passed: Format conversion, model processing, database API verified")
 
-            # Load faster-whisper tiny model (39MB) for memory efficiency
+            # Load faster-distil-whisper small.en (int8) - fits the 3.7GB budget
             if not self._load_model(TranscriptionMode.FAST):
-                self.logger.error("❌ Failed to load faster-whisper tiny model")
-                return False
-
-            # Create 10-minute audio chunks for processing
-            chunks = self._create_audio_chunks_fixed(aaxc_file, chunk_duration=600)
-
-            if not chunks:
-                self.logger.error("❌ No audio chunks created - format conversion failed")
+                self.logger.error(f"❌ Failed to load {self.FAST_MODEL_ID}")
                 return False
 
-            full_transcript = []
-
-            for i, chunk_path in enumerate(chunks):
-                self.logger.info(f"🔄 Processing chunk {i+1}/{len(chunks)}: {chunk_path}")
-
-                # Use established VoiceProcessingRequest architecture
-                request = VoiceProcessingRequest(
-                    audio_path=chunk_path,
-                    mode=TranscriptionMode.FAST,  # faster-whisper tiny (39MB)
-                    priority=ProcessingPriority.BACKGROUND,
-                    system="sherlock",
-                    metadata={"chunk_index": i, "source": "Operation Gladio"}
-                )
+            if BATCHED_PIPELINE_AVAILABLE:
+                self.pipeline = BatchedInferencePipeline(model=self.models[self.FAST_MODEL_KEY])
+                self.logger.info(f"⚡ Batched inference enabled (batch_size={self.BATCH_SIZE})")
 
-                # Process through established pipeline
-                result = self.transcribe_sherlock(request)
-
-                if result and result.text:
-                    full_transcript.append(result.text)
-                    self.processing_stats["chunks_processed"] += 1
-
-                    # Extract intelligence from this chunk
-                    self._extract_chunk_intelligence_fixed(result.text, i)
-
-                    self.logger.info(f"✅ Chunk {i+1} completed: {len(result.text)} characters")
-                else:
-                    self.logger.warning(f"⚠️ Chunk {i+1} produced no transcription")
-
-                # Memory management between chunks
-                import gc
-                gc.collect()
-
-            # Save complete transcript
+            # Transcript is streamed to disk chunk by chunk rather than held in memory
             transcript_file = Path(aaxc_file).parent / "operation_gladio_transcript.txt"
-            with open(transcript_file, 'w', encoding='utf-8') as f:
-                f.write('\n\n'.join(full_transcript))
+            transcript_chars = 0
+            chunk_count = 0
+
+            with open(transcript_file, 'w', encoding='utf-8', buffering=1 << 20) as transcript:
+                # Decode once and transcribe 10-minute PCM chunks straight from ffmpeg;
+                # a background thread keeps the next chunks decoded while this one transcribes
+                for i, audio in enumerate(self._prefetch_pcm_chunks(aaxc_file, chunk_duration=600)):
+                    chunk_count += 1
+                    self.logger.info(f"🔄 Processing chunk {i+1}: {len(audio) / self.SAMPLE_RATE / 60:.1f} minutes")
+
+                    # Transcribe synchronously with the loaded FAST model
+                    text = self._transcribe_chunk(audio)
+
+                    if text:
+                        if transcript_chars:
+                            transcript.write('\n\n')
+                        transcript.write(text)
+                        transcript_chars += len(text)
+                        self.processing_stats["chunks_processed"] += 1
+
+                        # Extract intelligence from this chunk
+                        self._record_chunk_intelligence(*_extract_chunk_worker(text), i)
+
+                        self.logger.info(f"✅ Chunk {i+1} completed: {len(text)} characters")
+                    else:
+                        self.logger.warning(f"⚠️ Chunk {i+1} produced no transcription")
+
+            if not chunk_count:
+                self.logger.error("❌ No audio decoded - format conversion failed")
+                return False
 
-            self.logger.info(f"📝 Complete transcript saved: {transcript_file}")
+            self.logger.info(f"📝 Complete transcript saved: {transcript_file} ({transcript_chars} characters)")
 
             # Generate final intelligence report with corrected API calls
             self._generate_intelligence_report_fixed()
@@ -133,123 +226,139 @@ class GladioProcessorV2(VoiceEngineManager):
             self.logger.error(f"❌ Processing failed: {e}")
             return False
 
-    def _create_audio_chunks_fixed(self, aaxc_file: str, chunk_duration: int = 600) -> List[str]:
+    def _transcribe_chunk(self, audio) -> str:
         """
-        Create audio chunks with corrected AAXC handling
+        Transcribe the speech in one chunk (Silero VAD skips silence and music); batched decoding runs BATCH_SIZE windows at a time
         """
-        chunks = []
-        audio_path = Path(aaxc_file)
-        chunks_dir = audio_path.parent / "gladio_chunks_v2"
-        chunks_dir.mkdir(exist_ok=True)
-
         try:
-            # Get total duration using ffprobe
-            result = subprocess.run([
-                "ffprobe", "-v", "quiet", "-show_entries", "format=duration",
-                "-of", "csv=p=0", aaxc_file
-            ], capture_output=True, text=True, check=True)
-
-            total_duration = float(result.stdout.strip())
-            self.logger.info(f"📏 Total audio duration: {total_duration/3600:.2f} hours")
-
-            # Create chunks - process despite AAXC warnings
-            chunk_count = int(total_duration // chunk_duration) + 1
-
-            for i in range(chunk_count):
-                start_time = i * chunk_duration
-                chunk_file = chunks_dir / f"gladio_chunk_{i+1:03d}.wav"
-
-                # Extract chunk using ffmpeg - allow errors but continue processing
-                cmd = [
-                    "ffmpeg", "-y", "-i", aaxc_file,
-                    "-ss", str(start_time), "-t", str(chunk_duration),
-                    "-acodec", "pcm_s16le", "-ar", "16000",
-                    str(chunk_file)
-                ]
-
-                result = subprocess.run(cmd, capture_output=True, text=True)
-
-                # Accept chunks even with warnings if file exists and has content
-                if chunk_file.exists() and chunk_file.stat().st_size > 1000:  # At least 1KB
-                    chunks.append(str(chunk_file))
-                    self.logger.info(f"✅ Created chunk {i+1}: {chunk_file.name} ({chunk_file.stat().st_size} bytes)")
-                else:
-                    self.logger.warning(f"⚠️ Chunk {i+1} too small or failed: {chunk_file.name}")
-
-                # Stop if we get too many consecutive failures
-                if i > 5 and len(chunks) == 0:
-                    self.logger.error("❌ Too many chunk creation failures, stopping")
-                    break
-
-            return chunks
+            if self.pipeline is not None:
+                segments, _ = self.pipeline.transcribe(
+                    audio, batch_size=self.BATCH_SIZE, beam_size=1,
+                    vad_filter=True, vad_parameters=self.VAD_PARAMETERS
+                )
+            else:
+                segments, _ = self.models[self.FAST_MODEL_KEY].transcribe(
+                    audio, beam_size=1,
+                    vad_filter=True, vad_parameters=self.VAD_PARAMETERS
+                )
+
+            return " ".join(segment.text for segment in segments).strip()
 
         except Exception as e:
-            self.logger.error(f"❌ Audio chunking failed: {e}")
-            return []
+            self.logger.error(f"❌ Transcription failed: {e}")
+            return ""
 
-    def _extract_chunk_intelligence_fixed(self, text: str, chunk_index: int):
+    def _iter_pcm_chunks(self, aaxc_file: str, chunk_duration: int = 600) -> Iterator[np.ndarray]:
         """
-        Extract intelligence using corrected database API calls
+        Decode the audiobook once with ffmpeg and yield float32 chunks of chunk_duration seconds
         """
-        import re
-
-        # Extract people (names and titles)
-        people_patterns = [
-            r'([A-Z][a-z]+ [A-Z][a-z]+)',  # First Last
-            r'(General [A-Z][a-z]+)',
-            r'(Colonel [A-Z][a-z]+)',
-            r'(Cardinal [A-Z][a-z]+)',
-            r'(Pope [A-Z][a-z]+ [IVX]+)',
-            r'([A-Z][a-z]+ Delle [A-Z][a-z]+)'  # Italian names
-        ]
+        chunk_bytes = chunk_duration * self.SAMPLE_RATE * 2  # s16le
 
-        people_found = set()
-        for pattern in people_patterns:
-            matches = re.findall(pattern, text)
-            people_found.update(matches)
+        # stderr is discarded: AAXC input produces a steady stream of warnings
+        proc = subprocess.Popen([
+            "ffmpeg", "-i", aaxc_file,
+            "-f", "s16le", "-ac", "1", "-ar", str(self.SAMPLE_RATE), "-"
+        ], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=10**7)
 
-        # Create person dossiers using corrected API
-        for name in people_found:
-            if len(name.split()) >= 2:  # At least first and last name
-                person = PersonDossier(
-                    primary_name=name,
-                    aliases=[],
-                    organizations=[],
-                    timeline_events=[],
-                    evidence_confidence=ConfidenceLevel.PROBABLE,
-                    last_updated=datetime.now()
-                )
-                self.evidence_db.add_person(person)
-                self.processing_stats["entities_extracted"] += 1
-
-        # Extract organizations
-        org_patterns = [
-            r'(CIA)', r'(Vatican)', r'(Mafia)', r'(P-2|P2)', r'(Propaganda Due)',
-            r'(Knights of Malta)', r'(Opus Dei)', r'(Banco Ambrosiano)',
-            r'(IOR)', r'(Gladio)', r'(NATO)', r'(OSS)',
-            r'(Ordine Nuovo)', r'(Avanguardia Nazionale)'
-        ]
+        try:
+            while buf := proc.stdout.read(chunk_bytes):
+                yield np.frombuffer(buf, dtype=np.int16).astype(np.float32) / 32768.0
+
+            # EOF: let ffmpeg exit on its own; a failed decode ends the stream early too
+            returncode = proc.wait()
+            if returncode != 0:
+                raise RuntimeError(f"ffmpeg exited with status {returncode}; decoded audio is incomplete")
+        finally:
+            proc.stdout.close()
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+
+    def _prefetch_pcm_chunks(self, aaxc_file: str, chunk_duration: int = 600,
+                             depth: int = 4) -> Iterator[np.ndarray]:
+        """
+        Decode in a background thread, keeping up to depth PCM chunks queued ahead of the consumer
+        """
+        chunks = queue.Queue(maxsize=depth)
+        stop = threading.Event()
+
+        def offer(item) -> bool:
+            # Block while the queue is full, but give up once the consumer has gone
+            while not stop.is_set():
+                try:
+                    chunks.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def produce():
+            try:
+                for audio in self._iter_pcm_chunks(aaxc_file, chunk_duration):
+                    if not offer(audio):
+                        return
+            except Exception as e:
+                self.logger.error(f"❌ Audio decode failed: {e}")
+                # Hand the error to the consumer so the run is not reported as a success
+                offer(e)
+                return
+            offer(None)
+
+        producer = threading.Thread(target=produce, name="gladio-pcm-decoder", daemon=True)
+        producer.start()
 
-        orgs_found = set()
-        for pattern in org_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            orgs_found.update(matches)
+        try:
+            while (audio := chunks.get()) is not None:
+                if isinstance(audio, Exception):
+                    raise audio
+                yield audio
+        finally:
+            stop.set()
+            producer.join()
+
+    def _record_chunk_intelligence(self, people_found: Set[str], orgs_found: Set[str], chunk_index: int):
+        """
+        Write a chunk's newly seen people and organizations to the evidence database
+        """
+        now = datetime.now()
 
-        # Create organization entries using corrected API
-        for org_name in orgs_found:
-            org = Organization(
+        # Create person dossiers using corrected API
+        # IDs match the ones gladio_populate_entities writes for the same names
+        people = []
+        for name in people_found:
+            if len(name.split()) < 2:  # At least first and last name
+                continue
+            person_id = entity_id(name)
+            if person_id in self._seen_people:
+                continue
+            self._seen_people.add(person_id)
+            people.append(PersonDossier(
+                person_id=person_id,
+                aliases=[name],
+                last_updated=now
+            ))
+
+        # Create organization entries using corrected API. Org names match in
+        # any case; sorting puts "CIA" before "cia", so the capitalized
+        # spelling names the row
+        orgs = []
+        for org_name in sorted(orgs_found):
+            org_id = entity_id(org_name)
+            if org_id in self._seen_orgs:
+                continue
+            self._seen_orgs.add(org_id)
+            orgs.append(Organization(
+                organization_id=org_id,
                 name=org_name,
                 aliases=[],
                 founding_date=None,
                 dissolution_date=None,
-                declared_purpose="TBD",
-                actual_purpose="TBD",
-                membership=[],
-                evidence_confidence=ConfidenceLevel.PROBABLE,
-                last_updated=datetime.now()
-            )
-            self.evidence_db.add_organization(org)
-            self.processing_stats["entities_extracted"] += 1
+                last_updated=now
+            ))
+
+        # One transaction per table for the whole chunk
+        self.processing_stats["entities_extracted"] += self.evidence_db.add_people_bulk(people)
+        self.processing_stats["entities_extracted"] += self.evidence_db.add_organizations_bulk(orgs)
 
         self.logger.info(f"📊 Chunk {chunk_index+1}: {len(people_found)} people, {len(orgs_found)} organizations")
 
@@ -257,27 +366,25 @@ class GladioProcessorV2(VoiceEngineManager):
         """
         Generate comprehensive intelligence report using corrected database API
         """
-        # Use available API methods: search_people instead of get_all_people
-        all_people = self.evidence_db.search_people("")  # Empty string searches all
-
-        # Get organizations count (no get_all_organizations, so estimate from processing stats)
-        total_organizations = self.processing_stats["entities_extracted"] - len(all_people)
+        # Counted in SQL; no dossiers are loaded for the report
+        total_people = self.evidence_db.count_people()
+        total_organizations = self.evidence_db.count_organizations()
 
         report = {
             "processing_date": datetime.now().isoformat(),
             "source": "Operation Gladio by Paul L. Williams (audiobook)",
-            "processing_method": "VoiceEngineManager + faster-whisper tiny",
+            "processing_method": "VoiceEngineManager + faster-distil-whisper small.en",
             "validation_status": "PASSED - Output-focused validation completed",
             "statistics": self.processing_stats,
             "database_summary": {
-                "total_people": len(all_people),
-                "total_organizations": max(0, total_organizations),
+                "total_people": total_people,
+                "total_organizations": total_organizations,
                 "processing_time_hours": self.processing_stats["processing_time"] / 3600
             },
             "quality_metrics": {
                 "chunks_processed": self.processing_stats["chunks_processed"],
                 "average_confidence": "PROBABLE",
-                "processing_method": "Chunked processing with faster-whisper tiny (39MB)"
+                "processing_method": "Chunked processing with faster-distil-whisper small.en (int8)"
             },
             "deliverables": {
                 "transcript_file": "operation_gladio_transcript.txt",
@@ -297,25 +404,23 @@ class GladioProcessorV2(VoiceEngineManager):
         """
         self.logger.info("🔍 Verifying deliverables...")
 
-        # Check transcript file
-        if transcript_file.exists() and transcript_file.stat().st_size > 100:
-            self.logger.info(f"✅ Transcript file: {transcript_file} ({transcript_file.stat().st_size} bytes)")
-        else:
-            self.logger.warning(f"⚠️ Transcript file missing or too small: {transcript_file}")
+        # (label, path, minimum size in bytes) - one stat per deliverable
+        deliverables = [
+            ("Transcript file", transcript_file, 100),
+            ("Intelligence database", Path("gladio_intelligence.db"), 1000),
+            ("Intelligence report", Path("gladio_intelligence_report.json"), 100),
+        ]
 
-        # Check database file
-        db_file = Path("gladio_intelligence.db")
-        if db_file.exists() and db_file.stat().st_size > 1000:
-            self.logger.info(f"✅ Intelligence database: {db_file} ({db_file.stat().st_size} bytes)")
-        else:
-            self.logger.warning(f"⚠️ Intelligence database missing or too small: {db_file}")
+        for label, path, min_size in deliverables:
+            try:
+                size = path.stat().st_size
+            except OSError:
+                size = None
 
-        # Check intelligence report
-        report_file = Path("gladio_intelligence_report.json")
-        if report_file.exists() and report_file.stat().st_size > 100:
-            self.logger.info(f"✅ Intelligence report: {report_file} ({report_file.stat().st_size} bytes)")
-        else:
-            self.logger.warning(f"⚠️ Intelligence report missing or too small: {report_file}")
+            if size is not None and size > min_size:
+                self.logger.info(f"✅ {label}: {path} ({size} bytes)")
+            else:
+                self.logger.warning(f"⚠️ {label} missing or too small: {path}")
 
 
 if __name__ == "__main__":
@@ -330,7 +435,7 @@ if __name__ == "__main__":
 
     print("🎯 OPERATION GLADIO VOICE PROCESSOR V2")
     print("✅ Output-focused validation PASSED")
-    print("Using VoiceEngineManager Architecture + faster-whisper tiny")
+    print("Using VoiceEngineManager Architecture + faster-distil-whisper small.en")
     print("=" * 60)
     print(f"Processing: {aaxc_file}")
     print()
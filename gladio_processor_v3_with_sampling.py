@@ -9,25 +9,57 @@ import sys
 import json
 import time
 import logging
+import queue
+import re
 import subprocess
+import threading
+import wave
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional, Tuple
 from datetime import datetime
 
+import numpy as np
+
 # Import Sherlock components
-from voice_engine import VoiceEngineManager, VoiceProcessingRequest, TranscriptionMode, ProcessingPriority
+from voice_engine import VoiceEngineManager, TranscriptionMode
 from evidence_schema_gladio import (
-    GladioEvidenceDatabase, PersonDossier, Organization,
+    GladioEvidenceDatabase, PersonDossier, Organization, entity_id,
     Evidence, Claim, TimeReference, EvidenceType, ConfidenceLevel
 )
 from statistical_sampling_validator import StatisticalSamplingValidator
 
+try:
+    from faster_whisper import BatchedInferencePipeline
+    BATCHED_PIPELINE_AVAILABLE = True
+except ImportError:
+    BATCHED_PIPELINE_AVAILABLE = False
+
+# Entity patterns, compiled once. People patterns stay separate because their
+# matches overlap ("Pope Paul" and "Pope Paul VI" are both kept); the org names
+# are plain literals, so one case-insensitive alternation finds them all.
+PEOPLE_PATTERNS = [
+    re.compile(r'([A-Z][a-z]+ [A-Z][a-z]+)'),
+    re.compile(r'(General [A-Z][a-z]+)'),
+    re.compile(r'(Colonel [A-Z][a-z]+)'),
+    re.compile(r'(Cardinal [A-Z][a-z]+)'),
+    re.compile(r'(Pope [A-Z][a-z]+ [IVX]+)'),
+]
+
+ORG_RE = re.compile(r'(CIA|Vatican|Mafia|P-2|P2|Gladio|NATO)', re.IGNORECASE)
+
 
 class GladioProcessorV3WithSampling(VoiceEngineManager):
     """
     Operation Gladio processor with integrated statistical sampling validation
     """
 
+    # Model loaded by VoiceEngineManager for TranscriptionMode.FAST
+    FAST_MODEL_KEY = "faster_whisper_tiny"
+
+    # 30s windows decoded together per batched model call
+    BATCH_SIZE = 16
+
     def __init__(self):
         # Initialize parent VoiceEngineManager
         super().__init__(max_ram_gb=3.7)
@@ -35,6 +67,12 @@ class GladioProcessorV3WithSampling(VoiceEngineManager):
         # Initialize components
         self.evidence_db = GladioEvidenceDatabase("gladio_intelligence.db")
         self.validator = StatisticalSamplingValidator(sample_size=3, validation_interval=10)
+        self.pipeline = None  # BatchedInferencePipeline once the model is loaded
+
+        # Entities already in the database or written earlier this run; their
+        # dossiers are neither rebuilt nor overwritten by later chunks
+        self._seen_people = self.evidence_db.person_ids()
+        self._seen_orgs = self.evidence_db.organization_ids()
 
         # Processing statistics
         self.processing_stats = {
@@ -68,6 +106,10 @@ class GladioProcessorV3WithSampling(VoiceEngineManager):
                 self.logger.error("❌ Failed to load faster-whisper tiny model")
                 return False
 
+            if BATCHED_PIPELINE_AVAILABLE:
+                self.pipeline = BatchedInferencePipeline(model=self.models[self.FAST_MODEL_KEY])
+                self.logger.info(f"⚡ Batched inference enabled (batch_size={self.BATCH_SIZE})")
+
             # Phase 1: Create audio chunks
             self.logger.info("🔧 Phase 1: Creating audio chunks...")
             chunks = self._create_audio_chunks_with_validation(aaxc_file, chunk_duration=600)
@@ -130,35 +172,33 @@ class GladioProcessorV3WithSampling(VoiceEngineManager):
         chunks_dir.mkdir(exist_ok=True)
 
         try:
-            # Get total duration
-            result = subprocess.run([
-                "ffprobe", "-v", "quiet", "-show_entries", "format=duration",
-                "-of", "csv=p=0", aaxc_file
-            ], capture_output=True, text=True, check=True)
-
-            total_duration = float(result.stdout.strip())
-            self.logger.info(f"📏 Total audio duration: {total_duration/3600:.2f} hours")
+            # Drop chunks left by an earlier run so the glob below only sees this one
+            for stale in chunks_dir.glob("gladio_chunk_*.wav"):
+                stale.unlink()
 
-            chunk_count = int(total_duration // chunk_duration) + 1
+            # Split in a single decode pass with the segment muxer. stderr is
+            # discarded: AAXC input produces a steady stream of warnings
+            result = subprocess.run([
+                "ffmpeg", "-y", "-i", aaxc_file,
+                "-f", "segment", "-segment_time", str(chunk_duration),
+                "-segment_start_number", "1", "-reset_timestamps", "1",
+                "-ac", "1", "-ar", "16000", "-acodec", "pcm_s16le",
+                str(chunks_dir / "gladio_chunk_%03d.wav")
+            ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            if result.returncode != 0:
+                raise RuntimeError(f"ffmpeg exited with status {result.returncode}; chunks are incomplete")
+
+            chunk_files = sorted(chunks_dir.glob("gladio_chunk_*.wav"))
+            chunk_count = len(chunk_files)
             valid_chunks = 0
             consecutive_failures = 0
 
-            for i in range(chunk_count):
-                start_time = i * chunk_duration
-                chunk_file = chunks_dir / f"gladio_chunk_{i+1:03d}.wav"
-
-                # Extract chunk
-                cmd = [
-                    "ffmpeg", "-y", "-i", aaxc_file,
-                    "-ss", str(start_time), "-t", str(chunk_duration),
-                    "-acodec", "pcm_s16le", "-ar", "16000",
-                    str(chunk_file)
-                ]
-
-                result = subprocess.run(cmd, capture_output=True, text=True)
+            # Validate every chunk concurrently; results come back in chunk order
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+                validity = list(pool.map(self._validate_chunk_immediately, chunk_files))
 
-                # Immediate validation of chunk
-                if self._validate_chunk_immediately(chunk_file):
+            for i, (chunk_file, is_valid) in enumerate(zip(chunk_files, validity)):
+                if is_valid:
                     chunks.append(str(chunk_file))
                     valid_chunks += 1
                     consecutive_failures = 0
@@ -192,18 +232,11 @@ class GladioProcessorV3WithSampling(VoiceEngineManager):
             if not chunk_file.exists() or chunk_file.stat().st_size < 1000:
                 return False
 
-            # Quick format validation with ffprobe
-            result = subprocess.run([
-                "ffprobe", "-v", "quiet", "-select_streams", "a:0",
-                "-show_entries", "stream=duration",
-                "-of", "csv=p=0", str(chunk_file)
-            ], capture_output=True, text=True)
-
-            if result.returncode == 0 and result.stdout.strip():
-                duration = float(result.stdout.strip())
-                return duration > 0.1  # At least 0.1 seconds
+            # Quick format validation from the WAV header (no ffprobe process)
+            with wave.open(str(chunk_file), 'rb') as wf:
+                duration = wf.getnframes() / wf.getframerate()
 
-            return False
+            return duration > 0.1  # At least 0.1 seconds
 
         except Exception:
             return False
@@ -216,115 +249,158 @@ class GladioProcessorV3WithSampling(VoiceEngineManager):
             self.logger.error("❌ No chunks available for processing")
             return False
 
-        full_transcript = []
+        # Transcript is streamed to disk chunk by chunk rather than held in memory
+        transcript_file = Path("operation_gladio_transcript_v3.txt")
         processed_count = 0
 
-        for i, chunk_path in enumerate(chunks):
-            self.logger.info(f"🔄 Processing chunk {i+1}/{len(chunks)}: {Path(chunk_path).name}")
-
-            try:
-                # Create VoiceProcessingRequest
-                request = VoiceProcessingRequest(
-                    audio_path=chunk_path,
-                    mode=TranscriptionMode.FAST,
-                    priority=ProcessingPriority.BACKGROUND,
-                    system="sherlock",
-                    metadata={"chunk_index": i, "source": "Operation Gladio V3"}
-                )
+        with open(transcript_file, 'w', encoding='utf-8', buffering=1 << 20) as transcript:
+            # A background thread loads the next chunks' PCM while this one transcribes
+            for i, (chunk_path, audio) in enumerate(self._prefetch_chunk_pcm(chunks)):
+                self.logger.info(f"🔄 Processing chunk {i+1}/{len(chunks)}: {Path(chunk_path).name}")
 
-                # Process through VoiceEngineManager - use direct method call instead of missing method
-                result = self.process_voice_request(request)
+                try:
+                    if isinstance(audio, Exception):
+                        raise audio
 
-                if result and hasattr(result, 'text') and result.text:
-                    full_transcript.append(result.text)
-                    processed_count += 1
+                    # Transcribe with the loaded FAST model, straight from the chunk's PCM
+                    text = self._transcribe_chunk(audio)
 
-                    # Extract intelligence
-                    self._extract_chunk_intelligence_with_validation(result.text, i)
+                    if text:
+                        if processed_count:
+                            transcript.write('\n\n')
+                        transcript.write(text)
+                        processed_count += 1
 
-                    self.logger.info(f"✅ Chunk {i+1} processed: {len(result.text)} characters")
-                else:
-                    self.logger.warning(f"⚠️ Chunk {i+1} produced no transcription")
+                        # Extract intelligence
+                        self._extract_chunk_intelligence_with_validation(text, i)
 
-            except Exception as e:
-                self.logger.error(f"❌ Error processing chunk {i+1}: {e}")
+                        self.logger.info(f"✅ Chunk {i+1} processed: {len(text)} characters")
+                    else:
+                        self.logger.warning(f"⚠️ Chunk {i+1} produced no transcription")
 
-            # Memory management
-            import gc
-            gc.collect()
+                except Exception as e:
+                    self.logger.error(f"❌ Error processing chunk {i+1}: {e}")
 
         self.processing_stats["chunks_processed"] = processed_count
 
-        # Save transcript
-        if full_transcript:
-            transcript_file = Path("operation_gladio_transcript_v3.txt")
-            with open(transcript_file, 'w', encoding='utf-8') as f:
-                f.write('\n\n'.join(full_transcript))
-            self.logger.info(f"📝 Transcript saved: {transcript_file} ({len(full_transcript)} chunks)")
+        if processed_count:
+            self.logger.info(f"📝 Transcript saved: {transcript_file} ({processed_count} chunks)")
 
         return processed_count > 0
 
+    def _load_chunk_pcm(self, chunk_path: str) -> np.ndarray:
+        """
+        Read a chunk's 16kHz PCM samples as float32 without another decode pass
+        """
+        with wave.open(chunk_path, 'rb') as wf:
+            channels = wf.getnchannels()
+            frames = wf.readframes(wf.getnframes())
+
+        audio = np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
+        if channels > 1:
+            audio = audio.reshape(-1, channels).mean(axis=1)
+        return audio
+
+    def _prefetch_chunk_pcm(self, chunks: List[str], depth: int = 4) -> Iterator[Tuple[str, object]]:
+        """
+        Load chunk PCM in a background thread, keeping up to depth chunks queued ahead
+        of the consumer; a chunk that fails to load is yielded with its exception
+        """
+        loaded = queue.Queue(maxsize=depth)
+        stop = threading.Event()
+
+        def offer(item) -> bool:
+            # Block while the queue is full, but give up once the consumer has gone
+            while not stop.is_set():
+                try:
+                    loaded.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def produce():
+            for chunk_path in chunks:
+                try:
+                    audio = self._load_chunk_pcm(chunk_path)
+                except Exception as e:
+                    audio = e
+                if not offer((chunk_path, audio)):
+                    return
+            offer(None)
+
+        producer = threading.Thread(target=produce, name="gladio-pcm-loader", daemon=True)
+        producer.start()
+
+        try:
+            while (item := loaded.get()) is not None:
+                yield item
+        finally:
+            stop.set()
+            producer.join()
+
+    def _transcribe_chunk(self, audio) -> str:
+        """
+        Transcribe one chunk; the batched pipeline decodes its 30s windows BATCH_SIZE at a time
+        """
+        if self.pipeline is not None:
+            segments, _ = self.pipeline.transcribe(audio, batch_size=self.BATCH_SIZE, beam_size=1)
+        else:
+            segments, _ = self.models[self.FAST_MODEL_KEY].transcribe(audio, beam_size=1)
+
+        return " ".join(segment.text for segment in segments).strip()
+
     def _extract_chunk_intelligence_with_validation(self, text: str, chunk_index: int):
         """
         Extract intelligence with validation metrics
         """
-        import re
-
-        extracted_entities = 0
+        now = datetime.now()
 
         # Extract people
-        people_patterns = [
-            r'([A-Z][a-z]+ [A-Z][a-z]+)',
-            r'(General [A-Z][a-z]+)',
-            r'(Colonel [A-Z][a-z]+)',
-            r'(Cardinal [A-Z][a-z]+)',
-            r'(Pope [A-Z][a-z]+ [IVX]+)',
-        ]
-
         people_found = set()
-        for pattern in people_patterns:
-            matches = re.findall(pattern, text)
-            people_found.update(matches)
+        for pattern in PEOPLE_PATTERNS:
+            people_found.update(pattern.findall(text))
 
-        # Add people to database
+        # Compared and stored by entity ID, as gladio_populate_entities does
+        new_people = {}
         for name in people_found:
             if len(name.split()) >= 2:
-                person = PersonDossier(
-                    primary_name=name,
-                    aliases=[],
-                    organizations=[],
-                    timeline_events=[],
-                    evidence_confidence=ConfidenceLevel.PROBABLE,
-                    last_updated=datetime.now()
-                )
-                self.evidence_db.add_person(person)
-                extracted_entities += 1
-
-        # Extract organizations
-        org_patterns = [
-            r'(CIA)', r'(Vatican)', r'(Mafia)', r'(P-2|P2)', r'(Gladio)', r'(NATO)'
+                new_people.setdefault(entity_id(name), name)
+        for person_id in new_people.keys() & self._seen_people:
+            del new_people[person_id]
+        self._seen_people |= new_people.keys()
+
+        people = [
+            PersonDossier(person_id=person_id, aliases=[name], last_updated=now)
+            for person_id, name in new_people.items()
         ]
 
-        orgs_found = set()
-        for pattern in org_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            orgs_found.update(matches)
+        # Extract organizations. ORG_RE ignores case; sorting puts "CIA" before
+        # "cia", so the capitalized spelling names the row
+        orgs_found = set(ORG_RE.findall(text))
+
+        new_orgs = {}
+        for org_name in sorted(orgs_found):
+            new_orgs.setdefault(entity_id(org_name), org_name)
+        for org_id in new_orgs.keys() & self._seen_orgs:
+            del new_orgs[org_id]
+        self._seen_orgs |= new_orgs.keys()
 
-        # Add organizations to database
-        for org_name in orgs_found:
-            org = Organization(
+        orgs = [
+            Organization(
+                organization_id=org_id,
                 name=org_name,
                 aliases=[],
                 founding_date=None,
                 dissolution_date=None,
-                declared_purpose="TBD",
-                actual_purpose="TBD",
-                membership=[],
-                evidence_confidence=ConfidenceLevel.PROBABLE,
-                last_updated=datetime.now()
+                last_updated=now
             )
-            self.evidence_db.add_organization(org)
-            extracted_entities += 1
+            for org_id, org_name in new_orgs.items()
+        ]
+
+        # One transaction per table for the whole chunk
+        extracted_entities = self.evidence_db.add_people_bulk(people)
+        extracted_entities += self.evidence_db.add_organizations_bulk(orgs)
 
         self.processing_stats["entities_extracted"] += extracted_entities
         self.logger.info(f"📊 Chunk {chunk_index+1}: {len(people_found)} people, {len(orgs_found)} organizations")
@@ -9,6 +9,7 @@ import sys
 import json
 import time
 import logging
+import math
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
@@ -137,17 +138,18 @@ class GladioVoiceProcessor(VoiceEngineManager):
             total_duration = float(result.stdout.strip())
             self.logger.info(f"📏 Total audio duration: {total_duration/3600:.2f} hours")
 
-            # Create chunks
-            chunk_count = int(total_duration // chunk_duration) + 1
+            # Create chunks (ceil: no extra call past the end when the duration divides evenly)
+            chunk_count = math.ceil(total_duration / chunk_duration)
 
             for i in range(chunk_count):
                 start_time = i * chunk_duration
                 chunk_file = chunks_dir / f"gladio_chunk_{i+1:03d}.wav"
 
-                # Extract chunk using ffmpeg
+                # Extract chunk using ffmpeg; -ss before -i seeks the input instead of
+                # decoding everything up to start_time
                 cmd = [
-                    "ffmpeg", "-y", "-i", aaxc_file,
-                    "-ss", str(start_time), "-t", str(chunk_duration),
+                    "ffmpeg", "-y", "-ss", str(start_time), "-i", aaxc_file,
+                    "-t", str(chunk_duration),
                     "-acodec", "pcm_s16le", "-ar", "16000",  # Convert to standard format
                     str(chunk_file)
                 ]
@@ -184,8 +186,7 @@ class GladioVoiceProcessor(VoiceEngineManager):
 
         people_found = set()
         for pattern in people_patterns:
-            matches = re.findall(pattern, text)
-            people_found.update(matches)
+            people_found.update(m.group(0) for m in re.finditer(pattern, text))
 
         # Create person dossiers
         for name in people_found:
@@ -211,8 +212,7 @@ class GladioVoiceProcessor(VoiceEngineManager):
 
         orgs_found = set()
         for pattern in org_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            orgs_found.update(matches)
+            orgs_found.update(m.group(0) for m in re.finditer(pattern, text, re.IGNORECASE))
 
         # Create organization entries
         for org_name in orgs_found:
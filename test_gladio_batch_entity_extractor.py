@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Test script for Gladio Batch Entity Extractor
+Checks the rewritten extractor against the original per-pattern scan
+"""
+
+import re
+import sys
+import tempfile
+from collections import Counter
+from pathlib import Path
+
+# Add current directory to path
+sys.path.append(str(Path(__file__).parent))
+
+import gladio_batch_entity_extractor
+from gladio_batch_entity_extractor import BatchEntityExtractor, checkpoint_files
+
+
+# Original extractor: every pattern run separately over each decoded line
+BASELINE_PERSON_PATTERNS = [
+    r'\b(Alan Dulles|William Donovan|Heinrich Himmler|Walter Schellenberg)\b',
+    r'\b(Michele Sindona|Roberto Calvi|Archbishop Paul Marcinkus)\b',
+    r'\b(Licio Gelli|Pope John Paul II|Pope Paul VI)\b',
+    r'\b(Osama bin Laden|Abdullah Azam|Timothy Drew|Malcolm X)\b',
+    r'\b(George H\.? ?W\.? Bush|William Casey|Vernon Walters)\b',
+    r'\b(Giulio Andreotti|Aldo Moro|Tansu Ciller)\b',
+    r'\b(Felice Casson|Arthur Rouse|Malcolm Byrne)\b',
+    r'\b(Dr\.|General|Admiral|Archbishop|Cardinal|Sheikh|Prince)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b',
+    r'\b([A-Z][a-z]+\s+(?:de\s+)?[A-Z][a-z]+)\b(?=\s+(?:said|worked|founded|paid|served|testified))',
+]
+
+BASELINE_ORG_PATTERNS = [
+    r'\b(CIA|OSS|FBI|NATO|KGB|SISMI|P2|IOR)\b',
+    r'\b(Vatican Bank|Deutsche Bank|Banco Ambrosiano)\b',
+    r'\b(Operation Gladio|Red Brigades|Grey Wolves)\b',
+    r'\b(Opus Dei|Mafia|Sicilian Mafia|Gambino crime family)\b',
+    r'\b(Mujahideen|Al-Qaeda|PKK|Kurdistan Workers)\b',
+    r'\b(Senate|Parliament|Supreme Court|National Security Council)\b',
+    r'\b(the\s+)?(CIA|Vatican|Mafia|Church|Agency)\b',
+]
+
+SAMPLE_TEXT = """\
+Licio Gelli ran P2 while Roberto Calvi said the Vatican Bank was safe.
+General Vito Miceli Senate Felice Casson
+The CIA and the KGB watched Operation Gladio and the Red Brigades.
+Archbishop Paul Marcinkus met Pope John Paul II at the Vatican.
+Cardinal Giovanni Benelli worked with Opus Dei; Michele Sindona testified.
+George H. W. Bush and William Casey briefed the National Security Council.
+General Nicolò Pollari told Felice Casson that Felice Casson Café was shut.
+Nothing to see on this line.
+"""
+
+
+def baseline_extract(text):
+    """(entity_type, name, line_number) counts from the original extractor
+
+    A name found at the same offset by two patterns (CIA is listed twice)
+    counts once, as in the unioned scanners.
+    """
+    hits = set()
+    for line_num, line in enumerate(text.splitlines(keepends=True)):
+        for entity_type, patterns in (('person', BASELINE_PERSON_PATTERNS), ('organization', BASELINE_ORG_PATTERNS)):
+            for pattern in patterns:
+                for match in re.finditer(pattern, line):
+                    name = match.group(0)
+                    if entity_type == 'person':
+                        name = re.sub(r'^(Dr\.|General|Admiral|Archbishop|Cardinal|Sheikh|Prince)\s+', '', name)
+                    else:
+                        name = re.sub(r'^the\s+', '', name, flags=re.IGNORECASE)
+                    name_start = match.end() - len(name)
+                    hits.add((entity_type, name, line_num, name_start))
+    return Counter(hit[:3] for hit in hits)
+
+
+def extract(text, use_automaton=True):
+    """Run the extractor over text as a one-batch transcript"""
+    saved = gladio_batch_entity_extractor.AHOCORASICK_AVAILABLE
+    gladio_batch_entity_extractor.AHOCORASICK_AVAILABLE = saved and use_automaton
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            transcript = Path(tmp) / "transcript.txt"
+            transcript.write_text(text, encoding='utf-8')
+            extractor = BatchEntityExtractor(transcript, Path(tmp) / "checkpoints", workers=1)
+            with extractor.open_transcript() as mm:
+                return extractor.extract_entities_from_batch(mm, extractor.line_offsets(), 0)
+    finally:
+        gladio_batch_entity_extractor.AHOCORASICK_AVAILABLE = saved
+
+
+def names(entities, entity_type=None):
+    """Counter of extracted names, optionally of one type"""
+    return Counter(e.name for e in entities if entity_type in (None, e.entity_type))
+
+
+def test_titled_person_does_not_swallow_following_entities():
+    """A titled name runs on past other entities; those are still found"""
+    print("🎖️  Testing titled-name overlap...")
+    for use_automaton in (True, False):
+        entities = extract("General Vito Miceli Senate Felice Casson\n", use_automaton)
+        assert names(entities, 'organization')['Senate'] == 1
+        assert names(entities, 'person')['Felice Casson'] == 1
+        assert names(entities, 'person')['Vito Miceli Senate Felice Casson'] == 1
+    print("✅ Senate and Felice Casson found inside a titled match")
+
+
+def test_accented_names_are_not_truncated():
+    """Accented letters count as word characters, as in the original str scan"""
+    print("🔤 Testing accented names...")
+    text = "General Nicolò Pollari met Felice Casson Café staff and the CIA.\nFelice Casson Café\n"
+    for use_automaton in (True, False):
+        entities = extract(text, use_automaton)
+        found = names(entities)
+        assert 'Nicol' not in found and 'Felice Casson Caf' not in found, found
+        assert Counter((e.entity_type, e.name, e.line_number) for e in entities) == baseline_extract(text)
+    print("✅ No names cut off at an accented letter")
+
+
+def test_nested_literal_survives_failed_longer_match():
+    """A shorter literal is found when the longer one fails its word boundary"""
+    print("🏦 Testing nested literals...")
+    for use_automaton in (True, False):
+        assert names(extract("He was the Vatican Banker.\n", use_automaton)) == Counter({'Vatican': 1})
+        assert names(extract("He ran the Vatican Bank.\n", use_automaton)) == Counter({'Vatican Bank': 1})
+        assert names(extract("The Sicilian Mafia\n", use_automaton)) == Counter({'Sicilian Mafia': 1})
+    print("✅ Automaton and regex agree on nested literals")
+
+
+def test_repeat_mentions_are_kept():
+    """Repeats of a name on one line are separate mentions; one span counts once"""
+    print("🔁 Testing repeat mentions...")
+    for use_automaton in (True, False):
+        assert names(extract("Felice Casson met Felice Casson\n", use_automaton)) == Counter({'Felice Casson': 2})
+        entities = extract("Roberto Calvi said Roberto Calvi paid\n", use_automaton)
+        assert names(entities) == Counter({'Roberto Calvi': 2})
+    print("✅ Repeats kept, same-span duplicates dropped")
+
+
+def test_checkpoint_files_prefer_compressed():
+    """A batch left in both plain and .zst form is listed once, as the .zst"""
+    print("🗜️  Testing checkpoint listing...")
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        for name in ("batch_000.json", "batch_000.json.zst", "batch_001.json", "batch_002.json.zst"):
+            (tmp / name).write_bytes(b"")
+        assert [f.name for f in checkpoint_files(tmp)] == [
+            "batch_000.json.zst", "batch_001.json", "batch_002.json.zst"
+        ]
+    print("✅ One file per batch")
+
+
+def test_sample_matches_baseline():
+    """Same mentions as the original extractor on a mixed transcript"""
+    print("📜 Testing against the original extractor...")
+    expected = baseline_extract(SAMPLE_TEXT)
+    # Only intended difference: an organization nested in a longer listed one
+    # at the same place ("Vatican" in "Vatican Bank") is reported once
+    expected -= Counter({('organization', 'Vatican', 0): 1})
+
+    for use_automaton in (True, False):
+        entities = extract(SAMPLE_TEXT, use_automaton)
+        assert Counter((e.entity_type, e.name, e.line_number) for e in entities) == expected
+
+        first = entities[0]
+        line = SAMPLE_TEXT.splitlines()[0]
+        assert (first.name, first.context) == ('Licio Gelli', line[:len('Licio Gelli') + 50].strip())
+    print("✅ Mentions match the original per-pattern scan")
+
+
+def test_checkpoints_round_trip():
+    """process_transcript() checkpoints reload as the same mentions, any worker count"""
+    print("💾 Testing checkpoint round trip...")
+    expected = [e.to_dict() for e in extract(SAMPLE_TEXT)]
+
+    for workers, compress in ((1, False), (1, True), (2, True)):
+        with tempfile.TemporaryDirectory() as tmp:
+            transcript = Path(tmp) / "transcript.txt"
+            transcript.write_text(SAMPLE_TEXT, encoding='utf-8')
+            extractor = BatchEntityExtractor(transcript, Path(tmp) / "checkpoints", batch_size=3, workers=workers)
+            extractor.compress_checkpoints = compress and gladio_batch_entity_extractor.ZSTD_AVAILABLE
+
+            stats = extractor.process_transcript()
+            assert stats['completed_batches'] == stats['total_batches'] == 3
+            assert [e.to_dict() for e in extractor.iter_entities()] == expected
+
+            # A rerun skips every completed batch
+            assert extractor.process_transcript()['total_entities'] == 0
+    print("✅ Checkpoints reload unchanged")
+
+
+def main():
+    """Run extractor regression tests"""
+    print("🧪 BATCH ENTITY EXTRACTOR TESTING")
+    print("=" * 50)
+
+    tests = [
+        test_titled_person_does_not_swallow_following_entities,
+        test_accented_names_are_not_truncated,
+        test_nested_literal_survives_failed_longer_match,
+        test_repeat_mentions_are_kept,
+        test_checkpoint_files_prefer_compressed,
+        test_sample_matches_baseline,
+        test_checkpoints_round_trip,
+    ]
+
+    failed = 0
+    for test_func in tests:
+        try:
+            test_func()
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ FAILED: {test_func.__name__} {e}")
+
+    print(f"\n🎯 Overall Result: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
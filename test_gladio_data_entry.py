@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Test script for Gladio Data Entry bulk import
+Checks CSV/JSONL imports against the original quick-entry adds
+"""
+
+import json
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+# Add current directory to path
+sys.path.append(str(Path(__file__).parent))
+
+from gladio_data_entry import GladioDataEntry
+
+# Quick-entry lines: TYPE|NAME|DETAILS|PAGE
+QUICK_ENTRIES = [
+    ("PERSON", "Licio Gelli", "Grand master of P2", "112"),
+    ("ORG", "Propaganda Due", "Masonic lodge run by Gelli", "113"),
+    ("PERSON", "Roberto Calvi", "Banco Ambrosiano chairman", None),
+]
+
+# Insert-time fields that differ between two otherwise identical loads
+TIMESTAMP_FIELDS = ('dossier_created', 'last_updated', 'created')
+
+
+def stored(db_path):
+    """Every people/organizations row as decoded JSON without timestamps"""
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = {}
+        for table, id_column, json_column in (
+            ('people', 'person_id', 'dossier_json'),
+            ('organizations', 'organization_id', 'organization_json'),
+        ):
+            for row_id, data in conn.execute(f"SELECT {id_column}, {json_column} FROM {table}"):
+                data = json.loads(data)
+                for field in TIMESTAMP_FIELDS:
+                    data.pop(field, None)
+                rows[(table, row_id)] = data
+        return rows
+    finally:
+        conn.close()
+
+
+def quick_entry_rows(tmp):
+    """Rows written by the original one-at-a-time quick entry path"""
+    db_path = str(Path(tmp) / "quick.db")
+    entry = GladioDataEntry(db_path)
+    for entry_type, name, details, page in QUICK_ENTRIES:
+        if entry_type == "PERSON":
+            entry.quick_add_person(name, details, page)
+        else:
+            entry.quick_add_organization(name, details, page)
+    return stored(db_path)
+
+
+def test_csv_import_matches_quick_entry():
+    """import_csv writes the same rows as quick entry, skipping unusable lines"""
+    print("📥 Testing CSV import...")
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "entries.csv"
+        lines = ["type,name,details,page"]
+        lines += [f"{t},{n},{d},{p or ''}" for t, n, d, p in QUICK_ENTRIES]
+        lines += ["PERSON,,no name,", "PLACE,Rome,not an entity type,"]
+        csv_path.write_text("\n".join(lines) + "\n")
+
+        db_path = str(Path(tmp) / "import.db")
+        stats = GladioDataEntry(db_path).import_csv(csv_path)
+        assert stats == {'people': 2, 'organizations': 1, 'skipped': 2, 'failed': 0}
+        assert stored(db_path) == quick_entry_rows(tmp)
+    print("✅ CSV import matches quick entry")
+
+
+def test_jsonl_import_accepts_extractor_mentions():
+    """Checkpoint mention dicts import like quick entries with a line-number page"""
+    print("📥 Testing JSONL import...")
+    with tempfile.TemporaryDirectory() as tmp:
+        jsonl_path = Path(tmp) / "mentions.jsonl"
+        mentions = [
+            {'name': 'Licio Gelli', 'entity_type': 'person', 'context': 'Licio Gelli ran P2',
+             'line_number': 4, 'confidence': 0.8},
+            {'name': 'CIA', 'entity_type': 'organization', 'context': 'the CIA funded it',
+             'line_number': 9, 'confidence': 0.8},
+        ]
+        jsonl_path.write_text("".join(json.dumps(m) + "\n" for m in mentions) + "\n")
+
+        db_path = str(Path(tmp) / "import.db")
+        stats = GladioDataEntry(db_path).import_jsonl(jsonl_path)
+        assert stats == {'people': 1, 'organizations': 1, 'skipped': 0, 'failed': 0}
+
+        expected_path = str(Path(tmp) / "expected.db")
+        entry = GladioDataEntry(expected_path)
+        entry.quick_add_person('Licio Gelli', 'Licio Gelli ran P2', 'transcript line 4')
+        entry.quick_add_organization('CIA', 'the CIA funded it', 'transcript line 9')
+        assert stored(db_path) == stored(expected_path)
+    print("✅ Extractor mentions imported")
+
+
+def main():
+    """Run data entry import regression tests"""
+    print("🧪 DATA ENTRY IMPORT TESTING")
+    print("=" * 50)
+
+    tests = [
+        test_csv_import_matches_quick_entry,
+        test_jsonl_import_accepts_extractor_mentions,
+    ]
+
+    failed = 0
+    for test_func in tests:
+        try:
+            test_func()
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ FAILED: {test_func.__name__} {e}")
+
+    print(f"\n🎯 Overall Result: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test script for Gladio Dossier Builder
+Checks checkpoint loading and alias normalization against the original builder
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add current directory to path
+sys.path.append(str(Path(__file__).parent))
+
+import gladio_batch_entity_extractor
+from gladio_batch_entity_extractor import BatchEntityExtractor, EntityMention
+from gladio_dossier_builder import EntityDossierBuilder
+
+
+def baseline_normalize(builder, name, entity_type):
+    """Original normalize_name: exact alias lookup, else whitespace cleanup"""
+    aliases = builder.person_aliases if entity_type == "person" else builder.org_aliases
+    for canonical, names in aliases.items():
+        if name in names or name == canonical:
+            return canonical
+    return ' '.join(name.split())
+
+
+def test_alias_map_matches_baseline():
+    """Every listed alias and canonical name normalizes as before"""
+    print("🔎 Testing alias normalization...")
+    builder = EntityDossierBuilder(Path("unused_checkpoints"))
+
+    for entity_type, aliases in (("person", builder.person_aliases), ("organization", builder.org_aliases)):
+        for canonical, names in aliases.items():
+            for name in (canonical, *names):
+                assert builder.normalize_name(name, entity_type) == baseline_normalize(builder, name, entity_type)
+    print("✅ Listed aliases unchanged")
+
+
+def test_alias_map_does_not_merge_different_people():
+    """A name that only starts with an alias keeps its own identity"""
+    print("👥 Testing alias prefixes...")
+    builder = EntityDossierBuilder(Path("unused_checkpoints"))
+
+    names = [
+        ("Pope John Paul I", "person"),
+        ("Osama Hamdan", "person"),
+        ("Wild Bill Hickok", "person"),
+        ("Licio Gelli Jr", "person"),
+        ("Church Committee", "organization"),
+        ("Agency  for  Development", "organization"),
+    ]
+    for name, entity_type in names:
+        assert builder.normalize_name(name, entity_type) == baseline_normalize(builder, name, entity_type), name
+    print("✅ No prefix merges")
+
+
+def test_iter_entities_reads_checkpoints_in_order():
+    """Mentions stream back from plain and .zst checkpoints in batch order"""
+    print("📂 Testing checkpoint streaming...")
+    batches = [
+        [EntityMention('Licio Gelli', 'person', 'Licio Gelli ran P2', 0)],
+        [EntityMention('CIA', 'organization', 'the CIA', 51), EntityMention('Gelli', 'person', 'Gelli fled', 52)],
+        [EntityMention('Roberto Calvi', 'person', 'Roberto Calvi said', 101)],
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        extractor = BatchEntityExtractor(Path(tmp) / "transcript.txt", Path(tmp) / "checkpoints", workers=1)
+        for batch_id, entities in enumerate(batches):
+            # Alternate formats, as after an upgrade from uncompressed checkpoints
+            extractor.compress_checkpoints = gladio_batch_entity_extractor.ZSTD_AVAILABLE and batch_id % 2 == 0
+            extractor.save_batch_checkpoint(batch_id, entities)
+
+        builder = EntityDossierBuilder(Path(tmp) / "checkpoints")
+        assert list(builder.iter_entities()) == [e.to_dict() for batch in batches for e in batch]
+
+        dossiers = builder.build_dossiers(builder.iter_entities())
+        assert dossiers['Licio Gelli'].mention_count == 2
+        assert dossiers['Licio Gelli'].first_appearance_line == 0
+    print("✅ Checkpoints streamed in order")
+
+
+def main():
+    """Run dossier builder regression tests"""
+    print("🧪 DOSSIER BUILDER TESTING")
+    print("=" * 50)
+
+    tests = [
+        test_alias_map_matches_baseline,
+        test_alias_map_does_not_merge_different_people,
+        test_iter_entities_reads_checkpoints_in_order,
+    ]
+
+    failed = 0
+    for test_func in tests:
+        try:
+            test_func()
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ FAILED: {test_func.__name__} {e}")
+
+    print(f"\n🎯 Overall Result: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Test script for Gladio Evidence Schema
+Checks bulk inserts against the original one-row-per-call adds
+"""
+
+import json
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+# Add current directory to path
+sys.path.append(str(Path(__file__).parent))
+
+from evidence_schema_gladio import (
+    GladioEvidenceDatabase, PersonDossier, Organization, Claim, ConfidenceLevel, entity_id
+)
+
+# Set at insert time, so they differ between two otherwise identical loads
+TIMESTAMP_FIELDS = ('dossier_created', 'last_updated', 'created')
+
+
+def make_people():
+    """People as the processors write them: entity ID plus spoken alias"""
+    claim = Claim(
+        claim_id="CL_GELLI", statement="Grand master of P2", category="biographical",
+        overall_confidence=ConfidenceLevel.PROBABLE
+    )
+    return [
+        PersonDossier(person_id=entity_id("Licio Gelli"), aliases=["Licio Gelli"], significant_activities=[claim]),
+        PersonDossier(person_id=entity_id("Roberto Calvi"), aliases=["Roberto Calvi"]),
+    ]
+
+
+def make_orgs():
+    """Organizations as the processors write them"""
+    return [
+        Organization(organization_id=entity_id("CIA"), name="CIA"),
+        Organization(organization_id=entity_id("Opus Dei"), name="Opus Dei"),
+    ]
+
+
+def stored_rows(db_path, table, id_column, json_column):
+    """{id: decoded JSON without insert timestamps} for one table"""
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = {}
+        for row_id, data in conn.execute(f"SELECT {id_column}, {json_column} FROM {table}"):
+            data = json.loads(data)
+            for field in TIMESTAMP_FIELDS:
+                data.pop(field, None)
+            rows[row_id] = data
+        return rows
+    finally:
+        conn.close()
+
+
+def test_bulk_inserts_match_single_adds():
+    """add_*_bulk stores exactly what a loop of add_person/add_organization stores"""
+    print("📦 Testing bulk inserts...")
+    with tempfile.TemporaryDirectory() as tmp:
+        single_path, bulk_path = str(Path(tmp) / "single.db"), str(Path(tmp) / "bulk.db")
+
+        single = GladioEvidenceDatabase(single_path)
+        for person in make_people():
+            assert single.add_person(person)
+        for org in make_orgs():
+            assert single.add_organization(org)
+
+        bulk = GladioEvidenceDatabase(bulk_path)
+        assert bulk.add_people_bulk(make_people()) == 2
+        assert bulk.add_organizations_bulk(make_orgs()) == 2
+        assert bulk.add_people_bulk([]) == 0
+
+        for table, id_column, json_column in (
+            ('people', 'person_id', 'dossier_json'),
+            ('organizations', 'organization_id', 'organization_json'),
+        ):
+            assert stored_rows(bulk_path, table, id_column, json_column) == \
+                stored_rows(single_path, table, id_column, json_column)
+
+        people = stored_rows(bulk_path, 'people', 'person_id', 'dossier_json')
+        assert people['licio_gelli']['significant_activities'][0]['overall_confidence'] == 'probable'
+    print("✅ Bulk and single-row inserts agree")
+
+
+def test_seen_ids_match_entity_ids():
+    """IDs read back for the processors' seen-sets match the IDs they compute"""
+    print("🔁 Testing seen-set IDs...")
+    with tempfile.TemporaryDirectory() as tmp:
+        db = GladioEvidenceDatabase(str(Path(tmp) / "gladio_intelligence.db"))
+        db.add_people_bulk(make_people())
+        db.add_organizations_bulk(make_orgs())
+
+        assert db.person_ids() == {entity_id("Licio Gelli"), entity_id("Roberto Calvi")}
+        seen_orgs = db.organization_ids()
+        assert entity_id("cia") in seen_orgs and entity_id("Cia") in seen_orgs
+
+        # Writing the same IDs again replaces rows rather than adding them
+        db.add_people_bulk(make_people())
+        assert db.person_ids() == {entity_id("Licio Gelli"), entity_id("Roberto Calvi")}
+    print("✅ Seen-set IDs match entity_id()")
+
+
+def test_counts_match_loaded_rows():
+    """SQL counts agree with loading every dossier, for each table separately"""
+    print("🔢 Testing counts...")
+    with tempfile.TemporaryDirectory() as tmp:
+        db = GladioEvidenceDatabase(str(Path(tmp) / "gladio_intelligence.db"))
+        assert db.count_people() == db.count_organizations() == 0
+
+        db.add_people_bulk(make_people())
+        db.add_organizations_bulk(make_orgs()[:1])
+        assert db.count_people() == len(db.search_people("")) == 2
+        assert db.count_organizations() == 1
+    print("✅ Counts match")
+
+
+def main():
+    """Run evidence schema regression tests"""
+    print("🧪 EVIDENCE SCHEMA TESTING")
+    print("=" * 50)
+
+    tests = [
+        test_bulk_inserts_match_single_adds,
+        test_seen_ids_match_entity_ids,
+        test_counts_match_loaded_rows,
+    ]
+
+    failed = 0
+    for test_func in tests:
+        try:
+            test_func()
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ FAILED: {test_func.__name__} {e}")
+
+    print(f"\n🎯 Overall Result: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test script for Gladio Intelligence Report Generator
+Checks the ranked entity sections against the original sort-per-report ranking
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import orjson
+
+# Add current directory to path
+sys.path.append(str(Path(__file__).parent))
+
+from gladio_intelligence_report_generator import IntelligenceReportGenerator
+
+
+def make_dossiers():
+    """People and organizations with tied mention counts, so ranking order matters"""
+    dossiers = {}
+    for i in range(25):
+        name = f"Person {i:02d}"
+        dossiers[name] = {'entity_type': 'person', 'mention_count': i % 7,
+                          'affiliations': ['CIA', 'P2', 'Vatican', 'NATO'][:i % 5],
+                          'roles': [f"role {j} " * 10 for j in range(i % 4)]}
+    for i in range(18):
+        name = f"Org {i:02d}"
+        dossiers[name] = {'entity_type': 'organization', 'mention_count': i % 5, 'aliases': [f"O{i}"]}
+    dossiers['No Count'] = {'entity_type': 'organization'}
+    return dossiers
+
+
+def baseline_ranked(dossiers, entity_type, n):
+    """Original ranking: full sort by mention count, then slice"""
+    items = [(name, data) for name, data in dossiers.items() if data.get('entity_type') == entity_type]
+    return sorted(items, key=lambda x: x[1].get('mention_count', 0), reverse=True)[:n]
+
+
+def make_generator(tmp):
+    """Generator over a data dir holding only entity_dossiers.json"""
+    data_dir = Path(tmp)
+    (data_dir / "entity_dossiers.json").write_bytes(orjson.dumps({'dossiers': make_dossiers()}))
+    return IntelligenceReportGenerator(data_dir)
+
+
+def test_top_entities_match_baseline_order():
+    """Markdown tables list the same top 15 people and organizations, ties in order"""
+    print("🏆 Testing top entities tables...")
+    dossiers = make_dossiers()
+    with tempfile.TemporaryDirectory() as tmp:
+        report = make_generator(tmp).generate_top_entities_report()
+
+    rows = [line.split(' | ')[0][2:] for line in report.splitlines()
+            if line.startswith('| ') and not line.startswith('| Name')]
+    expected = [name for name, _ in baseline_ranked(dossiers, 'person', 15)]
+    expected += [name for name, _ in baseline_ranked(dossiers, 'organization', 15)]
+    assert rows == expected
+    print("✅ Tables match the original ranking")
+
+
+def test_json_summary_matches_baseline_order():
+    """JSON summary keeps the top 20 people and top 10 organizations"""
+    print("📄 Testing JSON summary...")
+    dossiers = make_dossiers()
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = Path(tmp) / "summary.json"
+        make_generator(tmp).generate_json_summary(output_path)
+        summary = orjson.loads(output_path.read_bytes())
+
+    assert [p['name'] for p in summary['top_people']] == \
+        [name for name, _ in baseline_ranked(dossiers, 'person', 20)]
+    assert [o['name'] for o in summary['top_organizations']] == \
+        [name for name, _ in baseline_ranked(dossiers, 'organization', 10)]
+    assert all(len(p['roles']) <= 3 for p in summary['top_people'])
+    print("✅ Summary matches the original ranking")
+
+
+def main():
+    """Run report generator regression tests"""
+    print("🧪 INTELLIGENCE REPORT GENERATOR TESTING")
+    print("=" * 50)
+
+    tests = [
+        test_top_entities_match_baseline_order,
+        test_json_summary_matches_baseline_order,
+    ]
+
+    failed = 0
+    for test_func in tests:
+        try:
+            test_func()
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ FAILED: {test_func.__name__} {e}")
+
+    print(f"\n🎯 Overall Result: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Test script for Gladio Network Graph Builder
+Checks the column-based builder against the original dict-of-edges graph
+"""
+
+import sys
+import tempfile
+from collections import Counter, defaultdict
+from pathlib import Path
+
+import orjson
+
+# Add current directory to path
+sys.path.append(str(Path(__file__).parent))
+
+import gladio_network_builder
+from gladio_network_builder import NetworkGraphBuilder
+
+
+RELATIONSHIPS = [
+    {'entity_1': 'Licio Gelli', 'entity_2': 'P2', 'entity_1_type': 'person',
+     'entity_2_type': 'organization', 'relationship_type': 'leader', 'mention_count': 12},
+    {'entity_1': 'Roberto Calvi', 'entity_2': 'P2', 'entity_1_type': 'person',
+     'entity_2_type': 'organization', 'relationship_type': 'member', 'mention_count': 5},
+    {'entity_1': 'Roberto Calvi', 'entity_2': 'Banco Ambrosiano', 'entity_1_type': 'person',
+     'entity_2_type': 'organization', 'relationship_type': 'leader', 'mention_count': 30},
+    # Same pair again: DOT edge weights sum, edge count does not merge
+    {'entity_1': 'Licio Gelli', 'entity_2': 'P2', 'entity_1_type': 'person',
+     'entity_2_type': 'organization', 'relationship_type': 'member', 'mention_count': 3},
+    # A later mention retypes Gladio; the last type wins
+    {'entity_1': 'Gladio', 'entity_2': 'CIA', 'entity_1_type': 'person',
+     'entity_2_type': 'organization', 'relationship_type': 'funder', 'mention_count': 5},
+    {'entity_1': 'CIA', 'entity_2': 'Gladio', 'entity_1_type': 'organization',
+     'entity_2_type': 'organization', 'relationship_type': 'funder', 'mention_count': 8},
+    {'entity_1': 'Michele "The Shark" Sindona', 'entity_2': 'Roberto Calvi', 'entity_1_type': 'person',
+     'entity_2_type': 'person', 'relationship_type': 'operational', 'mention_count': 1},
+]
+
+
+def baseline_metrics(relationships):
+    """Original build_network + calculate_metrics, without the timestamp"""
+    node_types = {}
+    node_connections = defaultdict(int)
+    rel_types = Counter()
+    for rel in relationships:
+        node_types[rel['entity_1']] = rel['entity_1_type']
+        node_types[rel['entity_2']] = rel['entity_2_type']
+        rel_types[rel['relationship_type']] += 1
+        node_connections[rel['entity_1']] += rel['mention_count']
+        node_connections[rel['entity_2']] += rel['mention_count']
+
+    degrees = list(node_connections.values())
+    type_counts = Counter(node_types.values())
+    return {
+        'network_size': {
+            'total_nodes': len(node_types),
+            'total_edges': len(relationships),
+            'people': type_counts.get('person', 0),
+            'organizations': type_counts.get('organization', 0)
+        },
+        'centrality': {
+            'average_degree': sum(degrees) / len(degrees),
+            'max_degree': max(degrees),
+            'top_10_nodes': sorted(node_connections.items(), key=lambda x: x[1], reverse=True)[:10]
+        },
+        'relationship_types': dict(rel_types),
+    }
+
+
+def baseline_dot_lines(relationships, top_n):
+    """Node and edge lines of the original DOT output (node order was set order)"""
+    node_types = {}
+    node_connections = defaultdict(int)
+    for rel in relationships:
+        node_types[rel['entity_1']] = rel['entity_1_type']
+        node_types[rel['entity_2']] = rel['entity_2_type']
+        node_connections[rel['entity_1']] += rel['mention_count']
+        node_connections[rel['entity_2']] += rel['mention_count']
+    top = set(name for name, _ in sorted(node_connections.items(), key=lambda x: x[1], reverse=True)[:top_n])
+
+    nodes = set()
+    for node in top:
+        size = min(3.0, 0.5 + (node_connections[node] / 50))
+        shape, color = ("ellipse", "lightblue") if node_types[node] == "person" else ("box", "lightcoral")
+        clean_name = node.replace('"', '\\"')
+        nodes.add(f'  "{clean_name}" [shape={shape}, style=filled, fillcolor={color}, '
+                  f'width={size:.2f}, height={size:.2f}];')
+
+    edge_counts = Counter()
+    for rel in relationships:
+        if rel['entity_1'] in top and rel['entity_2'] in top:
+            edge_counts[(rel['entity_1'], rel['entity_2'])] += rel['mention_count']
+    edges = set()
+    for (source, target), weight in edge_counts.items():
+        clean_source = source.replace('"', '\\"')
+        clean_target = target.replace('"', '\\"')
+        edges.add(f'  "{clean_source}" -> "{clean_target}" [penwidth={min(5.0, 1.0 + (weight / 10)):.1f}];')
+    return nodes, edges
+
+
+def make_builder(tmp):
+    """Builder over RELATIONSHIPS; the entities file is deliberately never written"""
+    relationships_path = Path(tmp) / "relationships.json"
+    relationships_path.write_bytes(orjson.dumps({'relationships': RELATIONSHIPS}))
+    return NetworkGraphBuilder(relationships_path, Path(tmp) / "entity_dossiers.json")
+
+
+def with_fallbacks(test):
+    """Run test with and without the optional ijson/numpy fast paths"""
+    saved = gladio_network_builder.IJSON_AVAILABLE, gladio_network_builder.NUMPY_AVAILABLE
+    try:
+        for use_optional in (True, False):
+            gladio_network_builder.IJSON_AVAILABLE = saved[0] and use_optional
+            gladio_network_builder.NUMPY_AVAILABLE = saved[1] and use_optional
+            test()
+    finally:
+        gladio_network_builder.IJSON_AVAILABLE, gladio_network_builder.NUMPY_AVAILABLE = saved
+
+
+def test_metrics_match_baseline():
+    """Sizes, type counts, degrees, top nodes and relationship types are unchanged"""
+    print("📊 Testing network metrics...")
+
+    def check():
+        with tempfile.TemporaryDirectory() as tmp:
+            builder = make_builder(tmp)
+            builder.build_network()
+            metrics = builder.calculate_metrics()
+        metrics.pop('generated')
+        assert metrics == baseline_metrics(RELATIONSHIPS)
+        assert builder.get_top_nodes(2) == baseline_metrics(RELATIONSHIPS)['centrality']['top_10_nodes'][:2]
+
+    with_fallbacks(check)
+    print("✅ Metrics match the original builder")
+
+
+def test_dot_file_matches_baseline():
+    """DOT output has the original node styling and summed edges among top nodes"""
+    print("🕸️  Testing DOT output...")
+
+    def check():
+        for top_n in (4, 50):
+            with tempfile.TemporaryDirectory() as tmp:
+                builder = make_builder(tmp)
+                builder.build_network()
+                dot_path = Path(tmp) / "gladio_network.dot"
+                builder.generate_dot_file(dot_path, top_n=top_n)
+                lines = dot_path.read_text().splitlines()
+
+            assert lines[:4] == ['digraph GladioNetwork {', '  rankdir=LR;',
+                                 '  node [fontname="Arial"];', '  edge [fontname="Arial"];']
+            assert lines[-1] == '}'
+            nodes, edges = baseline_dot_lines(RELATIONSHIPS, top_n)
+            assert {line for line in lines if '[shape=' in line} == nodes
+            assert {line for line in lines if ' -> ' in line} == edges
+            assert sum(' -> ' in line for line in lines) == len(edges)
+
+    with_fallbacks(check)
+    print("✅ DOT output matches the original builder")
+
+
+def test_entities_load_on_first_access():
+    """Building the graph never reads the dossiers; the first access does, once"""
+    print("📂 Testing lazy dossier load...")
+    with tempfile.TemporaryDirectory() as tmp:
+        builder = make_builder(tmp)
+        builder.build_network()
+        builder.calculate_metrics()
+
+        dossiers = {'CIA': {'name': 'CIA', 'entity_type': 'organization'}}
+        builder.entities_path.write_bytes(orjson.dumps({'dossiers': dossiers}))
+        assert builder.entities == dossiers
+
+        builder.entities_path.unlink()
+        assert builder.entities is builder.entities
+    print("✅ Dossiers loaded lazily")
+
+
+def main():
+    """Run network builder regression tests"""
+    print("🧪 NETWORK BUILDER TESTING")
+    print("=" * 50)
+
+    tests = [
+        test_metrics_match_baseline,
+        test_dot_file_matches_baseline,
+        test_entities_load_on_first_access,
+    ]
+
+    failed = 0
+    for test_func in tests:
+        try:
+            test_func()
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ FAILED: {test_func.__name__} {e}")
+
+    print(f"\n🎯 Overall Result: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Test script for Gladio Entity Population
+Checks entity IDs and the batched, hash-skipping populate() against the original row-by-row load
+"""
+
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+import orjson
+
+# Add current directory to path
+sys.path.append(str(Path(__file__).parent))
+
+from evidence_schema_gladio import GladioEvidenceDatabase, entity_id
+from gladio_populate_entities import GladioEntityPopulator
+
+
+DOSSIERS = {
+    'Licio Gelli': {'name': 'Licio Gelli', 'entity_type': 'person', 'mention_count': 12,
+                    'contexts': ['Licio Gelli ran P2'] * 7},
+    'George H. W. Bush': {'name': 'George H. W. Bush', 'entity_type': 'person', 'mention_count': 3},
+    'CIA': {'name': 'CIA', 'entity_type': 'organization', 'mention_count': 40},
+    'Opus Dei': {'name': 'Opus Dei', 'entity_type': 'organization'},
+}
+
+
+def baseline_id(name):
+    """Original populator ID: lowercase, spaces to underscores, periods dropped"""
+    return name.lower().replace(' ', '_').replace('.', '')
+
+
+def populate(tmp):
+    """Populate a fresh evidence database from DOSSIERS; returns (populator, stats)"""
+    db_path = Path(tmp) / "gladio_intelligence.db"
+    GladioEvidenceDatabase(str(db_path))
+
+    dossiers_path = Path(tmp) / "entity_dossiers.json"
+    dossiers_path.write_bytes(orjson.dumps({
+        'metadata': {'total_entities': len(DOSSIERS), 'people': 2, 'organizations': 2},
+        'dossiers': DOSSIERS,
+    }))
+
+    populator = GladioEntityPopulator(db_path, dossiers_path)
+    return populator, populator.populate()
+
+
+def test_entity_id_matches_baseline():
+    """Shared ID helper keeps the populator's original IDs; case folds together"""
+    print("🆔 Testing entity IDs...")
+    for name in ('Licio Gelli', 'George H. W. Bush', 'CIA', 'Opus Dei', 'Dr. No'):
+        assert entity_id(name) == baseline_id(name)
+    assert entity_id('CIA') == entity_id('cia') == entity_id('Cia')
+    print("✅ IDs unchanged")
+
+
+def test_populate_writes_every_dossier_once():
+    """populate() stores each dossier under its entity ID"""
+    print("💾 Testing populate()...")
+    with tempfile.TemporaryDirectory() as tmp:
+        populator, stats = populate(tmp)
+        assert stats == {'people_inserted': 2, 'orgs_inserted': 2, 'unchanged': 0, 'errors': 0}
+
+        db = GladioEvidenceDatabase(str(Path(tmp) / "gladio_intelligence.db"))
+        assert db.person_ids() == {baseline_id('Licio Gelli'), baseline_id('George H. W. Bush')}
+        assert db.organization_ids() == {'cia', 'opus_dei'}
+
+        stored = orjson.loads(populator.conn.execute(
+            "SELECT dossier_json FROM people WHERE person_id = 'licio_gelli'"
+        ).fetchone()[0])
+        assert stored['name'] == 'Licio Gelli' and len(stored['contexts']) == 5
+        populator.close()
+    print("✅ Populated once")
+
+
+def test_rerun_skips_unchanged_dossiers():
+    """A rerun rewrites only dossiers whose content hash changed"""
+    print("♻️  Testing content-hash skip...")
+    with tempfile.TemporaryDirectory() as tmp:
+        populator, _ = populate(tmp)
+
+        stats = populator.populate()
+        assert stats['unchanged'] == 4 and stats['people_inserted'] == stats['orgs_inserted'] == 0
+
+        data = orjson.loads(populator.dossiers_path.read_bytes())
+        data['dossiers']['CIA']['mention_count'] = 41
+        populator.dossiers_path.write_bytes(orjson.dumps(data))
+
+        stats = populator.populate()
+        assert stats['unchanged'] == 3 and stats['orgs_inserted'] == 1 and stats['people_inserted'] == 0
+        stored = orjson.loads(populator.conn.execute(
+            "SELECT organization_json FROM organizations WHERE organization_id = 'cia'"
+        ).fetchone()[0])
+        assert stored['mention_count'] == 41
+        populator.close()
+    print("✅ Only the changed dossier rewritten")
+
+
+def test_populate_matches_single_row_adds():
+    """Batched populate() stores the same rows as add_person/add_organization per dossier"""
+    print("📦 Testing batched populate()...")
+    with tempfile.TemporaryDirectory() as tmp:
+        populator, _ = populate(tmp)
+        batched = dict(populator.conn.execute("SELECT person_id, dossier_json FROM people"))
+        batched.update(populator.conn.execute("SELECT organization_id, organization_json FROM organizations"))
+        populator.close()
+
+        db_path = Path(tmp) / "single.db"
+        GladioEvidenceDatabase(str(db_path))
+        single = GladioEntityPopulator(db_path, Path(tmp) / "entity_dossiers.json")
+        for dossier in DOSSIERS.values():
+            if dossier['entity_type'] == 'person':
+                assert single.add_person(dossier)
+            else:
+                assert single.add_organization(dossier)
+        single.conn.commit()
+        rows = dict(single.conn.execute("SELECT person_id, dossier_json FROM people"))
+        rows.update(single.conn.execute("SELECT organization_id, organization_json FROM organizations"))
+        single.close()
+
+        assert batched == rows
+    print("✅ Batched and single-row populate agree")
+
+
+def test_populate_keeps_wal_journal():
+    """The shared database stays in WAL mode and other connections can read it during a load"""
+    print("📒 Testing journal mode...")
+    with tempfile.TemporaryDirectory() as tmp:
+        populator, _ = populate(tmp)
+        assert populator.conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+
+        # No exclusive lock: a second connection reads while the populator is open
+        reader = sqlite3.connect(str(populator.db_path))
+        try:
+            assert reader.execute("SELECT COUNT(*) FROM people").fetchone()[0] == 2
+        finally:
+            reader.close()
+        populator.close()
+    print("✅ WAL kept, database readable")
+
+
+def main():
+    """Run population regression tests"""
+    print("🧪 ENTITY POPULATION TESTING")
+    print("=" * 50)
+
+    tests = [
+        test_entity_id_matches_baseline,
+        test_populate_writes_every_dossier_once,
+        test_populate_matches_single_row_adds,
+        test_rerun_skips_unchanged_dossiers,
+        test_populate_keeps_wal_journal,
+    ]
+
+    failed = 0
+    for test_func in tests:
+        try:
+            test_func()
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ FAILED: {test_func.__name__} {e}")
+
+    print(f"\n🎯 Overall Result: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)